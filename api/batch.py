@@ -0,0 +1,60 @@
+# api/batch.py
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Tuple
+
+from api.engines import analyze_topic
+
+if TYPE_CHECKING:
+    from api.topic_rules import TopicAnalysis
+
+
+MAX_BATCH_TOPICS = 1000
+
+Engine = Callable[["TopicAnalysis"], Dict[str, object]]
+
+
+def ndjson_line(obj: Dict[str, object]) -> bytes:
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def iter_batch(topics: List[str], engine: Engine) -> Iterator[Dict[str, object]]:
+    """
+    Run one engine over many topics.
+    Topics are deduped on the topic key (TopicAnalysis.key), so repeats cost one run.
+    Results come back in input order; a failing topic yields an error item
+    instead of aborting the batch.
+    """
+    done: Dict[str, Tuple[str, object]] = {}
+
+    for idx, text in enumerate(topics):
+        try:
+            analysis = analyze_topic(text)
+            key = analysis.key
+            if key not in done:
+                try:
+                    done[key] = ("result", engine(analysis))
+                except Exception as e:
+                    done[key] = ("error", str(e))
+            kind, value = done[key]
+        except Exception as e:
+            kind, value = "error", str(e)
+
+        yield {"index": idx, "input": text, kind: value}
+
+
+def iter_batch_ndjson(topics: List[str], engine: Engine) -> Iterator[bytes]:
+    # Duplicates share one result object; serialize it once.
+    encoded: Dict[int, str] = {}
+    for item in iter_batch(topics, engine):
+        if "result" not in item:
+            yield ndjson_line(item)
+            continue
+        result = item["result"]
+        body = encoded.get(id(result))
+        if body is None:
+            body = encoded[id(result)] = json.dumps(result, ensure_ascii=False)
+        head = json.dumps({"index": item["index"], "input": item["input"]}, ensure_ascii=False)
+        yield (head[:-1] + ', "result": ' + body + "}\n").encode("utf-8")
@@ -0,0 +1,211 @@
+# api/bundle.py
+#
+# Offline precomputed response bundle for known hot topics.
+#
+#   python -m api.bundle build --topics topics.txt --out bundle.ini
+#   INI_BUNDLE_PATH=bundle.ini python -m uvicorn api.main:app
+#
+# File layout (little-endian):
+#
+#   header  "INIBNDL1" | u64 index offset | u64 index length
+#   bodies  serialized response bodies, back to back
+#   index   JSON {"fingerprint", "engines", "encodings",
+#                 "entries": {engine: {topic key: {encoding: [offset, length]}}}}
+#
+# Topic keys are TopicAnalysis.key (the canonical topic).
+#
+# "identity" bodies are the compact JSON the API would send; compressed
+# variants are stored for bodies of at least MIN_COMPRESS_BYTES. The API
+# mmaps the file read-only, so workers share its pages through the OS page
+# cache and responses are slices of the mapping.
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+import warnings
+from typing import Dict, Iterable, List, Tuple
+
+from api.cache import tables_fingerprint
+from api.compression import ENCODERS, MIN_COMPRESS_BYTES
+from api.engines import ENGINES, analyze_topic
+from api.responses import dumps
+
+MAGIC = b"INIBNDL1"
+HEADER = struct.Struct("<8sQQ")
+IDENTITY = "identity"
+
+
+# -----------------------------
+# Build
+# -----------------------------
+def build_bundle(
+    topics: Iterable[str],
+    path: str,
+    engines: Iterable[str] = tuple(ENGINES),
+    encodings: Iterable[str] = tuple(ENCODERS),
+) -> Dict[str, int]:
+    """Run each engine over each distinct topic key and write the bundle."""
+    engines = list(engines)
+    encodings = [e for e in encodings if e in ENCODERS]
+    entries: Dict[str, Dict[str, Dict[str, List[int]]]] = {name: {} for name in engines}
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, 0, 0))
+        offset = HEADER.size
+
+        def put(body: bytes) -> List[int]:
+            nonlocal offset
+            f.write(body)
+            ref = [offset, len(body)]
+            offset += len(body)
+            return ref
+
+        seen = set()
+        for raw in topics:
+            analysis = analyze_topic(raw)
+            if not analysis.topic or analysis.key in seen:
+                continue
+            seen.add(analysis.key)
+            for name in engines:
+                body = dumps(ENGINES[name](analysis))
+                variants = {IDENTITY: put(body)}
+                if len(body) >= MIN_COMPRESS_BYTES:
+                    for enc in encodings:
+                        variants[enc] = put(ENCODERS[enc](body))
+                entries[name][analysis.key] = variants
+
+        index = json.dumps({
+            "fingerprint": tables_fingerprint(),
+            "engines": engines,
+            "encodings": encodings,
+            "entries": entries,
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        f.write(index)
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, offset, len(index)))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return {"topics": len(seen), "engines": len(engines), "bytes": offset + len(index)}
+
+
+# -----------------------------
+# Read
+# -----------------------------
+class Bundle:
+    """Read-only view of a bundle file; body() returns slices of the mapping."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mm)
+        magic, index_offset, index_len = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not an InI bundle")
+        index = json.loads(self._mm[index_offset:index_offset + index_len])
+        self.fingerprint: str = index["fingerprint"]
+        self.engines: List[str] = index["engines"]
+        self.encodings: List[str] = index["encodings"]
+        self._entries: Dict[str, Dict[str, Dict[str, List[int]]]] = index["entries"]
+        self.hits = 0
+        self.misses = 0
+
+    def body(self, engine: str, key: str, encoding: str | None) -> Tuple[str | None, memoryview] | None:
+        """
+        (content-encoding | None, body) for a topic key, or None if the
+        bundle does not have it. Falls back to identity when the requested
+        encoding was not stored (small bodies, or not built in).
+        """
+        variants = self._entries.get(engine, {}).get(key)
+        if variants is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if encoding is not None and encoding in variants:
+            off, n = variants[encoding]
+            return encoding, self._view[off:off + n]
+        off, n = variants[IDENTITY]
+        return None, self._view[off:off + n]
+
+    def topics(self, engine: str) -> List[str]:
+        return list(self._entries.get(engine, {}))
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "path": self.path,
+            "bytes": len(self._mm),
+            "fingerprint": self.fingerprint,
+            "engines": self.engines,
+            "encodings": self.encodings,
+            "topics": max((len(t) for t in self._entries.values()), default=0),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def open_bundle(path: str | None = None) -> Bundle | None:
+    """
+    Bundle at `path` (default: INI_BUNDLE_PATH), or None if unset. A bundle
+    built from different tables is ignored rather than served stale.
+    """
+    path = path if path is not None else os.getenv("INI_BUNDLE_PATH")
+    if not path:
+        return None
+    bundle = Bundle(path)
+    current = tables_fingerprint()
+    if bundle.fingerprint != current:
+        warnings.warn(
+            f"Ignoring bundle {path}: built for tables {bundle.fingerprint}, running {current}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return None
+    return bundle
+
+
+BUNDLE = open_bundle()
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+def _read_topics(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".json"):
+            return list(json.load(f))
+        return [line.strip() for line in f if line.strip()]
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m api.bundle")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="precompute responses for a topic list")
+    b.add_argument("--topics", required=True, help="one topic per line, or a JSON list (.json)")
+    b.add_argument("--out", required=True)
+    b.add_argument("--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES))
+    b.add_argument("--encodings", nargs="*", choices=list(ENCODERS), default=list(ENCODERS))
+    i = sub.add_parser("info", help="print a bundle's index summary")
+    i.add_argument("path")
+    args = parser.parse_args(argv)
+
+    if args.cmd == "info":
+        print(json.dumps(Bundle(args.path).stats(), indent=2))
+        return
+
+    start = time.perf_counter()
+    out = build_bundle(_read_topics(args.topics), args.out, args.engines, args.encodings)
+    print(
+        f"wrote {out['topics']} topics x {out['engines']} engines to {args.out} "
+        f"({out['bytes']} bytes, {time.perf_counter() - start:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+# api/cache.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Tuple
+
+from api.singleflight import ENGINE_FLIGHTS, SingleFlight
+
+if TYPE_CHECKING:
+    from api.topic_rules import TopicAnalysis
+
+
+# -----------------------------
+# Table fingerprint
+# (Cached responses are only valid for the tables that produced them.)
+# -----------------------------
+def tables_fingerprint() -> str:
+    # Imported here so caches can be created before the engines load.
+    from api.interrogate import ANSWER_GENERATORS, ARCHETYPE_MAP, ERA_HOOKS, KNOWLEDGE, SLOT_RULES
+    from api.topic_rules import TOPIC_RULES
+    from api.topic_types import TOPIC_TYPES
+
+    # Types as resolved: one declared without questions hashes the
+    # QUESTION_TEMPLATES it actually uses.
+    types = [tt._replace(questions=TOPIC_TYPES.questions(tt.name)) for tt in TOPIC_TYPES.types]
+    generators = {archetype: gen.__qualname__ for archetype, gen in ANSWER_GENERATORS.items()}
+    blob = json.dumps(
+        [
+            KNOWLEDGE.fingerprint(), ERA_HOOKS, ARCHETYPE_MAP, SLOT_RULES, generators,
+            TOPIC_RULES.canonical_tables, types,
+        ],
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def _estimate_size(value: object) -> int:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, tuple):
+        return sum(_estimate_size(v) for v in value)
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+# -----------------------------
+# LRU + TTL cache
+# -----------------------------
+class ResponseCache:
+    """
+    Bounded in-process memo for engine responses.
+    Evicts least-recently-used entries past max_entries or max_bytes, drops
+    entries older than ttl_seconds, and clears itself when the table
+    fingerprint changes. The fingerprint is first computed on the first
+    lookup. Cached values are shared: treat them as read-only.
+    """
+
+    # Calls are in-memory and cheap enough to make on the event loop.
+    blocking = False
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 3600.0,
+        fingerprint: Callable[[], str] = tables_fingerprint,
+        fingerprint_check_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._fingerprint_fn = fingerprint
+        self._fingerprint_check = fingerprint_check_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, size, value)
+        self._data: "OrderedDict[Hashable, Tuple[float, int, object]]" = OrderedDict()
+        self._bytes = 0
+        self.fingerprint: str | None = None
+        self._next_check = clock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_env(cls, prefix: str = "INI_CACHE") -> "ResponseCache":
+        return cls(
+            max_entries=int(os.getenv(f"{prefix}_MAX_ENTRIES", "1024")),
+            max_bytes=int(os.getenv(f"{prefix}_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl_seconds=float(os.getenv(f"{prefix}_TTL_SECONDS", "3600")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def refresh_fingerprint(self) -> bool:
+        """Recompute the table fingerprint; clear the cache if it changed."""
+        fp = self._fingerprint_fn()
+        with self._lock:
+            self._next_check = self._clock() + self._fingerprint_check
+            if fp == self.fingerprint:
+                return False
+            if self.fingerprint is not None:
+                self.invalidations += 1
+            self.fingerprint = fp
+            self._data.clear()
+            self._bytes = 0
+            return True
+
+    def get(self, key: Hashable):
+        if self._clock() >= self._next_check:
+            self.refresh_fingerprint()
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, value = entry
+            if self._clock() >= expires_at:
+                del self._data[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        if not self.enabled:
+            return
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        if self.fingerprint is None:
+            self.refresh_fingerprint()
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (self._clock() + self.ttl_seconds, size, value)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        if not self.enabled:
+            return compute()
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "memory",
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "fingerprint": self.fingerprint,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+# -----------------------------
+# Backend selection
+# INI_CACHE_BACKEND=memory (per worker) | sqlite (shared by all workers on the host)
+# -----------------------------
+CACHE_BACKEND = os.getenv("INI_CACHE_BACKEND", "memory")
+
+
+def open_cache(prefix: str = "INI_CACHE"):
+    """A response cache for `prefix`, on the backend chosen by INI_CACHE_BACKEND."""
+    if CACHE_BACKEND == "memory":
+        return ResponseCache.from_env(prefix)
+    if CACHE_BACKEND == "sqlite":
+        from api.shared_cache import SqliteResponseCache
+
+        return SqliteResponseCache(
+            path=os.getenv("INI_SHARED_CACHE_PATH") or None,
+            namespace=prefix,
+            max_entries=int(os.getenv(f"{prefix}_MAX_ENTRIES", "10000")),
+            max_bytes=int(os.getenv(f"{prefix}_MAX_BYTES", str(256 * 1024 * 1024))),
+            ttl_seconds=float(os.getenv(f"{prefix}_TTL_SECONDS", "3600")),
+            fingerprint=tables_fingerprint,
+        )
+    raise ValueError(f"Unknown cache backend: {CACHE_BACKEND!r} (expected 'memory' or 'sqlite')")
+
+
+RESPONSE_CACHE = open_cache("INI_CACHE")
+
+
+def cached_engine(
+    name: str,
+    engine: Callable[[TopicAnalysis], Dict[str, object]],
+    cache=RESPONSE_CACHE,
+    flights: SingleFlight = ENGINE_FLIGHTS,
+) -> Callable[[TopicAnalysis], Dict[str, object]]:
+    """
+    Wrap an analysis-level engine so results are memoized per topic key,
+    and concurrent misses for one key share a single computation.
+    """
+
+    def run(analysis: TopicAnalysis) -> Dict[str, object]:
+        key = (name, analysis.key)
+        value = cache.get(key) if cache.enabled else None
+        if value is None:
+            value = flights.do(key, lambda: _compute_and_put(key, analysis))
+        return value
+
+    def _compute_and_put(key, analysis: TopicAnalysis) -> Dict[str, object]:
+        value = engine(analysis)
+        cache.put(key, value)
+        return value
+
+    run.__name__ = f"cached_{name}"
+    return run
@@ -0,0 +1,77 @@
+# api/compact.py
+#
+# Dictionary-encoded wire format for interrogation responses.
+# Answers and archetype labels repeat a lot within one response, so they
+# go into a deduplicated string table and items refer to them by index:
+#
+#   {"format": "compact", "strings": [...],
+#    "fields": ["id", "question", "answer", "archetype"],
+#    "categories": {"What": [["what_1", "What is ...?", 0, 1], ...]}, ...}
+#
+# Answer index is null for questions-only responses.
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+from api.interrogate import interrogate_analysis, interrogate_questions_analysis
+from api.masks import FieldMask
+from api.topic_rules import TopicAnalysis
+
+
+COMPACT_FIELDS = ["id", "question", "answer", "archetype"]
+
+
+def encode_compact(result: Dict[str, object]) -> Dict[str, object]:
+    strings: List[str] = []
+    index: Dict[str, int] = {}
+
+    def ref(s: str | None) -> int | None:
+        if s is None:
+            return None
+        i = index.get(s)
+        if i is None:
+            i = index[s] = len(strings)
+            strings.append(s)
+        return i
+
+    categories = {
+        cat: [[it["id"], it["question"], ref(it.get("answer")), ref(it["archetype"])] for it in items]
+        for cat, items in result["categories"].items()
+    }
+
+    out = {k: v for k, v in result.items() if k != "categories"}
+    out.update({
+        "format": "compact",
+        "fields": COMPACT_FIELDS,
+        "strings": strings,
+        "categories": categories,
+    })
+    return out
+
+
+def decode_compact(payload: Dict[str, object]) -> Dict[str, object]:
+    """Inverse of encode_compact()."""
+    strings = payload["strings"]
+    categories = {}
+    for cat, rows in payload["categories"].items():
+        items = []
+        for qid, question, answer, archetype in rows:
+            item = {"id": qid, "archetype": strings[archetype], "question": question}
+            if answer is not None:
+                item["answer"] = strings[answer]
+            items.append(item)
+        categories[cat] = items
+
+    out = {k: v for k, v in payload.items() if k not in ("format", "fields", "strings", "categories")}
+    out["categories"] = categories
+    return out
+
+
+# Module-level engines (picklable for the process pool).
+def interrogate_compact_analysis(analysis: TopicAnalysis, mask: FieldMask | None = None) -> Dict[str, object]:
+    return encode_compact(interrogate_analysis(analysis, mask=mask))
+
+
+def interrogate_questions_compact_analysis(analysis: TopicAnalysis, mask: FieldMask | None = None) -> Dict[str, object]:
+    return encode_compact(interrogate_questions_analysis(analysis, mask=mask))
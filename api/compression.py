@@ -0,0 +1,118 @@
+# api/compression.py
+
+from __future__ import annotations
+
+import gzip
+import os
+from typing import Dict, List, Tuple
+
+from api.cache import open_cache
+from api.metrics import stage
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+
+# Responses smaller than this are sent uncompressed.
+MIN_COMPRESS_BYTES = int(os.getenv("INI_COMPRESS_MIN_BYTES", "1024"))
+
+GZIP_LEVEL = int(os.getenv("INI_GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("INI_BROTLI_QUALITY", "5"))
+ZSTD_LEVEL = int(os.getenv("INI_ZSTD_LEVEL", "3"))
+
+
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _brotli(body: bytes) -> bytes:
+    return brotli.compress(body, quality=BROTLI_QUALITY)
+
+
+def _zstd(body: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+
+
+# Server preference order (best ratio/speed first), limited to what is installed.
+ENCODERS: Dict[str, object] = {}
+if zstandard is not None:
+    ENCODERS["zstd"] = _zstd
+if brotli is not None:
+    ENCODERS["br"] = _brotli
+ENCODERS["gzip"] = _gzip
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    prefs: Dict[str, float] = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        prefs[token] = q
+    return prefs
+
+
+def negotiate(accept_encoding: str | None) -> str | None:
+    """Pick the best installed encoding the client accepts, or None for identity."""
+    if not accept_encoding:
+        return None
+    prefs = _parse_accept_encoding(accept_encoding)
+    wildcard = prefs.get("*", 0.0)
+    best, best_q = None, 0.0
+    for enc in ENCODERS:
+        q = prefs.get(enc, wildcard)
+        if q > best_q:
+            best, best_q = enc, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    with stage("compress"):
+        return ENCODERS[encoding](body)
+
+
+# -----------------------------
+# Pre-compressed bodies for hot topics
+# key: (engine, topic key, encoding) -> (content-encoding | None, body)
+# -----------------------------
+COMPRESSED_CACHE = open_cache("INI_COMPRESSED_CACHE")
+
+
+def encoded_body(key: Tuple, encoding: str, serialize) -> Tuple[str | None, bytes]:
+    """
+    Body for `key` in `encoding`, compressing at most once per cache entry.
+    `serialize()` produces the raw JSON bytes on a miss. Bodies under
+    MIN_COMPRESS_BYTES come back uncompressed (encoding None).
+    """
+    cache_key = key + (encoding,)
+    hit = COMPRESSED_CACHE.get(cache_key) if COMPRESSED_CACHE.enabled else None
+    if hit is not None:
+        return hit
+
+    with stage("serialize"):
+        raw = serialize()
+    if len(raw) < MIN_COMPRESS_BYTES:
+        out: Tuple[str | None, bytes] = (None, raw)
+    else:
+        out = (encoding, compress(raw, encoding))
+    COMPRESSED_CACHE.put(cache_key, out)
+    return out
+
+
+def available_encodings() -> List[str]:
+    return list(ENCODERS)
@@ -0,0 +1,119 @@
+# api/engines.py
+#
+# Analysis-level engines by name: what the routes, the response cache and
+# the offline bundle key their results on.
+#
+# Engines are registered as "module:function" specs and imported on first
+# use, so `import api.main` does not pay for engine modules or the tables
+# they compile at import (knowledge store, topic matcher, plans).
+# warm_up() loads everything ahead of traffic; main.py runs it in the
+# background at startup (INI_WARMUP).
+
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Mapping
+
+if TYPE_CHECKING:
+    from api.topic_rules import TopicAnalysis
+
+Engine = Callable[["TopicAnalysis"], Dict[str, object]]
+
+ENGINE_SPECS: Dict[str, str] = {
+    "interrogate": "api.interrogate:interrogate_analysis",
+    "interrogate_questions": "api.interrogate:interrogate_questions_analysis",
+    "interrogate_compact": "api.compact:interrogate_compact_analysis",
+    "interrogate_questions_compact": "api.compact:interrogate_questions_compact_analysis",
+    "illustrate": "api.illustrate:illustrate_analysis",
+}
+
+
+def _resolve(spec: str):
+    module, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module), attr)
+
+
+class LazyFunction:
+    """Callable stand-in that imports `module:function` on first call."""
+
+    __slots__ = ("spec", "_fn")
+
+    def __init__(self, spec: str):
+        self.spec = spec
+        self._fn = None
+
+    def resolve(self):
+        if self._fn is None:
+            self._fn = _resolve(self.spec)
+        return self._fn
+
+    def __call__(self, *args, **kwargs):
+        fn = self._fn
+        if fn is None:
+            fn = self.resolve()
+        return fn(*args, **kwargs)
+
+
+class LazyEngines(Mapping):
+    """name -> engine function, importing each engine's module on first lookup."""
+
+    def __init__(self, specs: Dict[str, str]):
+        self._specs = specs
+        self._loaded: Dict[str, Engine] = {}
+
+    def __getitem__(self, name: str) -> Engine:
+        fn = self._loaded.get(name)
+        if fn is None:
+            fn = self._loaded[name] = _resolve(self._specs[name])
+        return fn
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._specs)
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def loaded(self) -> list:
+        return list(self._loaded)
+
+
+ENGINES = LazyEngines(ENGINE_SPECS)
+
+# Non-engine entry points the routes call directly.
+analyze_topic = LazyFunction("api.interrogate:analyze_topic")
+answer_question = LazyFunction("api.interrogate:answer_question")
+iter_interrogation = LazyFunction("api.interrogate:iter_interrogation")
+question_ids = LazyFunction("api.interrogate:question_ids")
+illustration_support_map = LazyFunction("api.illustrate:illustration_support_map")
+
+_LAZY_FUNCTIONS = (analyze_topic, answer_question, iter_interrogation, question_ids, illustration_support_map)
+
+
+# -----------------------------
+# Warm-up
+# -----------------------------
+WARMUP: Dict[str, object] = {"state": "cold", "seconds": None}
+_warmup_lock = threading.Lock()
+
+
+def warm_up() -> Dict[str, object]:
+    """Import every engine and entry point now (idempotent)."""
+    with _warmup_lock:
+        if WARMUP["state"] == "ready":
+            return WARMUP
+        WARMUP["state"] = "warming"
+        start = time.perf_counter()
+        for name in ENGINES:
+            ENGINES[name]
+        for fn in _LAZY_FUNCTIONS:
+            fn.resolve()
+        WARMUP.update(state="ready", seconds=round(time.perf_counter() - start, 4))
+        return WARMUP
+
+
+def warm_up_in_background() -> threading.Thread:
+    t = threading.Thread(target=warm_up, name="ini-warmup", daemon=True)
+    t.start()
+    return t
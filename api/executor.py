@@ -0,0 +1,91 @@
+# api/executor.py
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict
+
+from starlette.concurrency import run_in_threadpool
+
+
+EXECUTION_MODES = ("threadpool", "thread", "process")
+
+
+class Overloaded(Exception):
+    """Raised when the engine pool already has its queue limit of waiting jobs."""
+
+
+class EnginePool:
+    """
+    Where engine work runs for async routes.
+
+    mode="threadpool": Starlette's shared threadpool (same as plain def routes).
+    mode="thread" / "process": a dedicated pool of `workers`, admitting at
+    most `queue_limit` waiting jobs beyond the running ones. Past that,
+    run() raises Overloaded immediately instead of queueing.
+    """
+
+    def __init__(self, mode: str = "threadpool", workers: int | None = None, queue_limit: int = 64):
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {mode!r} (expected one of {EXECUTION_MODES})")
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_limit = queue_limit
+        self._executor: Executor | None = None
+        self._in_flight = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls) -> "EnginePool":
+        workers = os.getenv("INI_WORKERS")
+        return cls(
+            mode=os.getenv("INI_EXECUTION_MODE", "threadpool"),
+            workers=int(workers) if workers else None,
+            queue_limit=int(os.getenv("INI_QUEUE_LIMIT", "64")),
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ini-engine")
+        return self._executor
+
+    async def run(self, fn: Callable, *args):
+        if self.mode == "threadpool":
+            return await run_in_threadpool(fn, *args)
+
+        # Admission is checked and updated on the event loop thread only.
+        if self._in_flight >= self.workers + self.queue_limit:
+            self.rejected += 1
+            raise Overloaded(f"{self._in_flight} engine jobs in flight")
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            if self.mode == "thread":
+                # Carry request context (e.g. Server-Timing stages) into the worker.
+                return await loop.run_in_executor(self._get_executor(), contextvars.copy_context().run, fn, *args)
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "in_flight": self._in_flight,
+            "rejected": self.rejected,
+        }
+
+
+ENGINE_POOL = EnginePool.from_env()
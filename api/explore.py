@@ -0,0 +1,36 @@
+# api/explore.py
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable
+
+from api.engines import illustration_support_map
+
+if TYPE_CHECKING:
+    from api.topic_rules import TopicAnalysis
+
+
+EXPLORE_SECTIONS = ("interrogation", "illustration", "supports")
+
+
+def validate_sections(sections: Iterable[str] | None) -> tuple:
+    """Requested sections in canonical order; None means all of them."""
+    if sections is None:
+        return EXPLORE_SECTIONS
+    wanted = set(sections)
+    unknown = wanted - set(EXPLORE_SECTIONS)
+    if unknown:
+        raise ValueError(f"Unknown sections: {sorted(unknown)} (expected {list(EXPLORE_SECTIONS)})")
+    return tuple(s for s in EXPLORE_SECTIONS if s in wanted)
+
+
+def explore_header(analysis: TopicAnalysis) -> Dict[str, object]:
+    return {
+        "topic": analysis.topic,
+        "topic_type": analysis.topic_type,
+        "confidence": analysis.confidence,
+    }
+
+
+def explore_supports(analysis: TopicAnalysis) -> dict:
+    return illustration_support_map(analysis.topic_type)
@@ -0,0 +1,295 @@
+# api/export.py
+#
+# Offline bulk export of study packs: every topic in a file through the
+# engines, in a process pool, written in chunks.
+#
+#   python -m api.export --topics curriculum.txt --out packs.jsonl
+#   python -m api.export --topics curriculum.txt --out packs/ --format parquet
+#   python -m api.export ... --resume          # continue after an interruption
+#
+# Topics are read lazily and processed in chunks of --chunk-size; at most
+# --workers * 2 chunks are in flight, so memory stays bounded however long
+# the file is. Chunks are written in input order. After each one a
+# checkpoint (<out>.ckpt) records how far the output is complete; --resume
+# drops anything written after it and skips the topics already done.
+#
+# JSONL: one line per topic, {"index", "input", "topic", "topic_type",
+# "confidence", <engine>: result...} or {"index", "input", "error"}.
+# Parquet (needs pyarrow): one part file per chunk under <out>/, engine
+# results stored as JSON strings.
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple
+
+from api.engines import ENGINES, analyze_topic
+from api.responses import dumps
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # optional: only needed for --format parquet
+    pyarrow = None
+
+EXPORT_FORMATS = ("jsonl", "parquet")
+
+Chunk = List[Tuple[int, str]]
+
+
+# -----------------------------
+# Worker side (module-level, picklable)
+# -----------------------------
+def _export_records(chunk: Chunk, engines: List[str]) -> List[Dict[str, object]]:
+    """One record per input line; repeats of a topic key within the chunk run once."""
+    done: Dict[str, Dict[str, object]] = {}
+    records = []
+    for idx, text in chunk:
+        try:
+            analysis = analyze_topic(text)
+            fields = done.get(analysis.key)
+            if fields is None:
+                fields = {
+                    "topic": analysis.topic,
+                    "topic_type": analysis.topic_type,
+                    "confidence": analysis.confidence,
+                }
+                for name in engines:
+                    fields[name] = ENGINES[name](analysis)
+                done[analysis.key] = fields
+            records.append({"index": idx, "input": text, **fields})
+        except Exception as e:
+            records.append({"index": idx, "input": text, "error": str(e)})
+    return records
+
+
+def run_chunk_jsonl(chunk: Chunk, engines: List[str]) -> bytes:
+    return b"".join(dumps(r) + b"\n" for r in _export_records(chunk, engines))
+
+
+def run_chunk_columns(chunk: Chunk, engines: List[str]) -> Dict[str, list]:
+    records = _export_records(chunk, engines)
+    columns: Dict[str, list] = {
+        "index": [r["index"] for r in records],
+        "input": [r["input"] for r in records],
+        "topic": [r.get("topic") for r in records],
+        "topic_type": [r.get("topic_type") for r in records],
+        "confidence": [r.get("confidence") for r in records],
+        "error": [r.get("error") for r in records],
+    }
+    for name in engines:
+        columns[name] = [dumps(r[name]).decode("utf-8") if name in r else None for r in records]
+    return columns
+
+
+# -----------------------------
+# Output sinks
+# -----------------------------
+class JsonlSink:
+    def __init__(self, path: str, resume_bytes: int):
+        self.path = path
+        self._f = open(path, "ab" if resume_bytes else "wb")
+        if resume_bytes:
+            self._f.truncate(resume_bytes)  # drop a chunk written after the last checkpoint
+            self._f.seek(resume_bytes)
+
+    def write(self, payload: bytes) -> None:
+        self._f.write(payload)
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def position(self) -> int:
+        return self._f.tell()
+
+    def close(self) -> None:
+        self._f.close()
+
+
+class ParquetSink:
+    def __init__(self, directory: str, first_part: int):
+        self.directory = directory
+        self._part = first_part
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, columns: Dict[str, list]) -> None:
+        path = os.path.join(self.directory, f"part-{self._part:06d}.parquet")
+        pyarrow.parquet.write_table(pyarrow.table(columns), path + ".tmp")
+        os.replace(path + ".tmp", path)
+        self._part += 1
+
+    def position(self) -> int:
+        return self._part
+
+    def close(self) -> None:
+        pass
+
+
+# -----------------------------
+# Checkpoints
+# -----------------------------
+def checkpoint_path(out: str) -> str:
+    return out.rstrip("/\\") + ".ckpt"
+
+
+def load_checkpoint(out: str) -> Dict[str, object] | None:
+    path = checkpoint_path(out)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_checkpoint(out: str, state: Dict[str, object]) -> None:
+    path = checkpoint_path(out)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+
+
+# -----------------------------
+# Driver
+# -----------------------------
+def iter_chunks(path: str, chunk_size: int, skip: int = 0) -> Iterator[Chunk]:
+    """(line index, topic) chunks, read lazily; blank lines are skipped but keep their index."""
+    with open(path, encoding="utf-8") as f:
+        lines = ((i, line.strip()) for i, line in enumerate(f))
+        lines = ((i, t) for i, t in itertools.islice(lines, skip, None) if t)
+        while True:
+            chunk = list(itertools.islice(lines, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+class _Inline:
+    """Executor stand-in for --workers 0 (run chunks in this process)."""
+
+    def submit(self, fn, *args) -> Future:
+        fut: Future = Future()
+        try:
+            fut.set_result(fn(*args))
+        except Exception as e:
+            fut.set_exception(e)
+        return fut
+
+    def shutdown(self, wait: bool = True) -> None:
+        pass
+
+
+def export(
+    topics_path: str,
+    out: str,
+    fmt: str = "jsonl",
+    engines: List[str] | None = None,
+    workers: int | None = None,
+    chunk_size: int = 500,
+    resume: bool = False,
+    report=sys.stderr,
+) -> Dict[str, object]:
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown format: {fmt!r} (expected one of {EXPORT_FORMATS})")
+    if fmt == "parquet" and pyarrow is None:
+        raise RuntimeError("--format parquet needs pyarrow (pip install pyarrow)")
+    engines = list(engines or ("interrogate", "illustrate"))
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    state = {"lines_done": 0, "position": 0, "chunk_size": chunk_size, "engines": engines, "format": fmt}
+    if resume:
+        saved = load_checkpoint(out)
+        if saved is not None:
+            if (saved["engines"], saved["format"]) != (engines, fmt):
+                raise ValueError("--resume: engines/format differ from the checkpoint")
+            state = saved
+            chunk_size = saved["chunk_size"]
+
+    with open(topics_path, encoding="utf-8") as f:
+        total_lines = sum(1 for _ in f)
+
+    if fmt == "jsonl":
+        sink = JsonlSink(out, state["position"])
+        run_chunk = run_chunk_jsonl
+    else:
+        sink = ParquetSink(out, state["position"])
+        run_chunk = run_chunk_columns
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 0 else _Inline()
+    max_in_flight = max(1, workers) * 2
+    start = time.perf_counter()
+    start_lines = state["lines_done"]
+    topics_done = 0
+
+    # (chunk, future) in input order; written strictly from the front.
+    pending: List[Tuple[Chunk, Future]] = []
+    chunks = iter_chunks(topics_path, chunk_size, skip=state["lines_done"])
+
+    def write_front() -> None:
+        nonlocal topics_done
+        chunk, fut = pending.pop(0)
+        sink.write(fut.result())
+        topics_done += len(chunk)
+        state["lines_done"] = chunk[-1][0] + 1
+        state["position"] = sink.position()
+        save_checkpoint(out, state)
+
+        elapsed = time.perf_counter() - start
+        rate = topics_done / elapsed if elapsed else 0.0
+        lines_left = total_lines - state["lines_done"]
+        eta = lines_left / rate if rate else 0.0
+        print(
+            f"[export] {state['lines_done']:,}/{total_lines:,} lines  "
+            f"{rate:,.0f} topics/s  eta {eta:,.0f}s",
+            file=report, flush=True,
+        )
+
+    try:
+        for chunk in chunks:
+            pending.append((chunk, pool.submit(run_chunk, chunk, engines)))
+            while len(pending) >= max_in_flight or (pending and pending[0][1].done()):
+                write_front()
+        while pending:
+            write_front()
+    finally:
+        pool.shutdown(wait=True)
+        sink.close()
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        "topics": topics_done,
+        "lines_done": state["lines_done"],
+        "resumed_from_line": start_lines,
+        "seconds": round(elapsed, 3),
+        "topics_per_second": round(topics_done / elapsed, 1) if elapsed else 0.0,
+        "out": out,
+    }
+    print(f"[export] done: {json.dumps(summary)}", file=report, flush=True)
+    return summary
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m api.export")
+    parser.add_argument("--topics", required=True, help="one topic per line")
+    parser.add_argument("--out", required=True, help="JSONL file, or a directory for parquet parts")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="jsonl")
+    parser.add_argument("--engines", nargs="+", choices=list(ENGINES), default=["interrogate", "illustrate"])
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count; 0 = inline)")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--resume", action="store_true", help="continue from <out>.ckpt")
+    args = parser.parse_args(argv)
+
+    export(
+        args.topics, args.out, args.format, args.engines,
+        workers=args.workers, chunk_size=args.chunk_size, resume=args.resume,
+    )
+
+
+if __name__ == "__main__":
+    main()
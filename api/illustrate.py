@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Dict, List
-from api.interrogate import detect_topic_type, extract_topic
+from typing import Dict
+from api.interrogate import analyze_topic
+from api.masks import FieldMask
+from api.metrics import stage
+from api.topic_rules import TopicAnalysis
+from api.topic_types import TOPIC_TYPES
 
 
 
@@ -13,120 +17,42 @@ from api.interrogate import detect_topic_type, extract_topic
 
 
 def illustration_support_map(topic_type: str) -> dict:
-    if topic_type == "troubleshooting":
-        return {
-            "symptom": "Describe",
-            "root_cause": "Isolate",
-            "fix": "Fix",
-            "prevention": "Fix",
-        }
-
-    if topic_type == "decision":
-        return {
-            "option_a": "Options",
-            "option_b": "Options",
-            "tradeoff": "Tradeoffs",
-            "regret_case": "Risks",
-        }
-
-    if topic_type == "skill":
-        return {
-            "beginner": "Basics",
-            "practice": "Practice",
-            "mistake": "Common Mistakes",
-            "progress": "Next Level",
-        }
-
-    if topic_type == "comparison":
-        return {
-            "side_by_side": "Differences",
-            "winner_case": "Who Should Choose What",
-            "loser_case": "Common Traps",
-            "tie_case": "Decision Rule",
-        }
-
-    # concept
-    return {
-        "everyday": "What",
-        "work": "Where",
-        "analogy": "How",
-        "failure": "Why",
-    }
-
-
-
-
-def build_illustrations(topic: str, topic_type: str) -> dict:
-    t = topic
-
-    if topic_type == "troubleshooting":
-        return {
-            "symptom": f"A real-world symptom where {t} appears.",
-            "root_cause": "A common underlying cause for this issue.",
-            "fix": "A safe first fix most people should try.",
-            "prevention": "How to avoid this issue in the future.",
-        }
-
-    if topic_type == "decision":
-        return {
-            "option_a": f"Scenario where choosing one option in {t} makes sense.",
-            "option_b": f"Scenario where the alternative is better.",
-            "tradeoff": "What you gain vs what you give up.",
-            "regret_case": "A common regret people report after deciding poorly.",
-        }
-
-    if topic_type == "skill":
-        return {
-            "beginner": f"A beginner practicing {t} for the first time.",
-            "practice": "A concrete practice exercise.",
-            "mistake": "A mistake beginners commonly make.",
-            "progress": "What improvement looks like after consistent practice.",
-        }
-
-    if topic_type == "comparison":
-        return {
-            "side_by_side": f"A vs B comparison scenario for {t}.",
-            "winner_case": "When option A clearly wins.",
-            "loser_case": "When option B is the wrong choice.",
-            "tie_case": "When both options are equally acceptable.",
-        }
-
-    # default: concept
-    return {
-        "everyday": f"An everyday example of {t}.",
-        "work": f"A professional use of {t}.",
-        "analogy": f"An analogy to explain {t} simply.",
-        "failure": f"What goes wrong without understanding {t}.",
-    }
+    """Illustration key -> interrogation heading it supports (from the type registry)."""
+    return TOPIC_TYPES.support_map(topic_type)
 
 
+# Low-confidence topics get only the first few illustrations.
+LOW_CONFIDENCE_ILLUSTRATIONS = 2
 
 
+def build_illustrations(topic: str, topic_type: str, limit: int | None = None) -> dict:
+    """Format the first `limit` illustrations for the type (all by default)."""
+    templates = TOPIC_TYPES.illustration_parts(topic_type)
+    return {key: topic.join(parts) for key, parts in templates[:limit]}
 
 
 def illustrate(topic: str) -> Dict[str, object]:
-    clean_topic = extract_topic(topic)
-    topic_type, confidence = detect_topic_type(clean_topic)
-    supports = illustration_support_map(topic_type)
+    return illustrate_analysis(analyze_topic(topic))
 
-    illustrations = build_illustrations(clean_topic, topic_type)
 
+def illustrate_analysis(analysis: TopicAnalysis, mask: FieldMask | None = None) -> Dict[str, object]:
+    """Illustration depth adapts to confidence; `mask` can lower it further or drop supports."""
+    clean_topic, topic_type, confidence, _ = analysis
 
-    if confidence < 0.5:
-        illustrations = dict(list(illustrations.items())[:2])
+    limit = LOW_CONFIDENCE_ILLUSTRATIONS if confidence < 0.5 else None
+    if mask is not None and mask.limit is not None:
+        limit = mask.limit if limit is None else min(limit, mask.limit)
 
+    with stage("build_illustrations"):
+        illustrations = build_illustrations(clean_topic, topic_type, limit)
 
-
-
-
-
-    return {
+    out = {
         "topic": clean_topic,
         "topic_type": topic_type,
         "confidence": confidence,
         "illustrations": illustrations,
         "notes": ["v0: illustration depth adapts to confidence"],
-        "supports": supports,
     }
-
-
+    if mask is None or mask.supports:
+        out["supports"] = illustration_support_map(topic_type)
+    return out
@@ -1,4 +1,13 @@
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Tuple
+
+from api.knowledge import open_knowledge_store
+from api.masks import FieldMask
+from api.metrics import stage
+from api.topic_rules import TOPIC_RULES, TopicAnalysis
+from api.topic_types import TOPIC_TYPES
+
+Core = Dict[str, object]
 
 
 # -----------------------------
@@ -49,14 +58,48 @@ def get_era_note(topic: str) -> str | None:
 
 # -----------------------------
 # Topic Core (COHESION ENGINE)
+# In-code seed for the knowledge store (api/knowledge.py). A core may
+# carry per-slot prose; any slot it leaves out uses the generic answer.
 # -----------------------------
 TOPIC_CORE = {
     "artificial intelligence": {
+        "aliases": {
+            "exact": ["ai"],
+            "contains": ["artificial intelligence"],
+        },
         "one_liner": "AI is software that achieves goals by learning patterns from data to predict, generate, or decide.",
+        "orient": {
+            "plain": [
+                "In practice, AI systems learn from examples (data) and generalize to new inputs.",
+                "They can be powerful, but they are limited by data quality, evaluation, and how they’re used."
+            ],
+            "problem": [
+                "AI exists because many real-world tasks are too complex for hand-written rules.",
+                "It helps when you need predictions/decisions/generation based on patterns in large data."
+            ],
+            "benefits": [
+                "Benefits: speed and scale (automation), pattern detection, and decision support.",
+                "It’s most valuable when it augments people and processes—especially with good evaluation."
+            ],
+            "limitations": [
+                "Limitations: it can be confidently wrong, inherit bias, and fail when the environment changes (drift).",
+                "You need evaluation, monitoring, and guardrails—especially in high-stakes uses."
+            ],
+            "confused": [
+                "People often confuse AI with human understanding or reasoning.",
+                "Most AI is pattern-based: it can look smart without truly understanding."
+            ],
+        },
         "mechanism": [
             "Pipeline: data → model → training (optimize loss) → evaluation → deployment → monitoring.",
             "Under the hood: models adjust parameters to reduce error on examples."
         ],
+        "mechanism_check": [
+            "Mechanism check (do you really understand it?):",
+            "• what the inputs/outputs are\n• what data it learns from\n• what objective it optimizes\n• how you evaluate it\n• what can make it fail (bias/drift).",
+            "If you can explain the pipeline and how you’d test failures, you understand it."
+        ],
+        "apply_heading": "Where you see AI in real life:",
         "apply": [
             "Recommendations (what to watch/buy next).",
             "Search ranking (what results appear first).",
@@ -65,6 +108,21 @@ TOPIC_CORE = {
             "Translation and speech (text↔speech, language translation).",
             "Content generation (text/code/images, with guardrails).",
         ],
+        "apply_fail": [
+            "Where it breaks in practice:",
+            "• data drift (the world changes)\n• biased or incomplete data\n• missing evaluation/monitoring\n• using it outside tested scope.",
+            "Most failures happen because humans overtrust outputs without verification."
+        ],
+        "apply_simple_example": [
+            "Simple example: spam detection.",
+            "A model learns from labeled emails (spam/not spam) and predicts the label for new emails.",
+            "It works well when training data matches the real inbox and you monitor drift."
+        ],
+        "misconception": [
+            "Common misconception:",
+            "AI 'understands' like a human. It usually doesn’t—it matches patterns.",
+            "This misconception leads to overtrust and missed failure modes."
+        ],
         "risk": [
             "AI does not truly understand; it matches patterns.",
             "Main failure mode is overtrust without evaluation or monitoring.",
@@ -79,62 +137,39 @@ TOPIC_CORE = {
     }
 }
 
+KNOWLEDGE = open_knowledge_store(TOPIC_CORE)
+
 
 def _get_core_key(topic: str) -> str | None:
     """
-    Return a TOPIC_CORE key if the topic matches.
-    v0: only AI core is defined.
+    Return a knowledge-store key if the topic matches one of its aliases.
     """
-    tl = (topic or "").strip().lower()
-    if "artificial intelligence" in tl or tl == "ai":
-        return "artificial intelligence"
-    return None
+    return KNOWLEDGE.core_key_for(topic or "")
 
 
 # -----------------------------
-# Topic extraction
+# Topic extraction + type detection
+# (rules live in api/topic_rules.py and are compiled once at import)
 # -----------------------------
 def extract_topic(text: str) -> str:
-    t = text.strip().lower()
-    prefixes = [
-        "explain to me",
-        "explain",
-        "tell me about",
-        "can you teach me about",
-        "teach me about",
-        "help me understand",
-        "what is",
-        "what are",
-        "how to",
-        "how do i",
-    ]
-    for p in prefixes:
-        if t.startswith(p):
-            t = t[len(p):].strip()
-            break
-    t = t.rstrip("?.!")
-    return " ".join(w.capitalize() for w in t.split())
+    return TOPIC_RULES.clean(text)
 
 
-# -----------------------------
-# Topic type detection
-# -----------------------------
 def detect_topic_type(topic: str) -> Tuple[str, float]:
-    t = topic.lower()
-
-    if any(x in t for x in [" vs ", " versus ", "compare"]):
-        return "comparison", 0.67
-
-    if any(x in t for x in ["should i", "better", "choose"]):
-        return "decision", 0.67
+    """Detected on the canonical key, like analyze_topic()."""
+    return TOPIC_RULES.detect(TOPIC_RULES.key(topic))
 
-    if any(x in t for x in ["error", "not working", "failed", "issue"]):
-        return "troubleshooting", 0.75
 
-    if any(x in t for x in ["learn", "practice", "how to"]):
-        return "skill", 0.67
-
-    return "concept", 0.67
+def analyze_topic(text: str) -> TopicAnalysis:
+    """
+    Clean topic, type and confidence in one call.
+    Engines should prefer this over extract_topic + detect_topic_type.
+    """
+    with stage("extract_topic"):
+        clean, key = TOPIC_RULES.canonical(text)
+    with stage("detect_topic_type"):
+        topic_type, confidence = TOPIC_RULES.detect(key)
+    return TopicAnalysis(clean, topic_type, confidence, key)
 
 
 # -----------------------------
@@ -155,43 +190,49 @@ def build_summary(topic: str, topic_type: str, confidence: float) -> List[str]:
     ]
 
 
+# -----------------------------
+# Question slots
+# (question templates are declared per topic type in api/topic_types.py)
+# -----------------------------
+# Slot detection for free-form questions passed to attach_answers.
+# First matching rule wins; no match means "default".
+SLOT_RULES: Dict[str, List[Tuple[str, List[str]]]] = {
+    "ORIENT": [
+        ("plain", ["plain language"]),
+        ("problem", ["problem"]),
+        ("benefits", ["benefits"]),
+        ("limitations", ["limitations"]),
+        ("confused", ["confused"]),
+    ],
+    "MECHANISM": [
+        ("check", ["tell if", "truly understand"]),
+    ],
+    "APPLY": [
+        ("fail", ["fail"]),
+        ("simple_example", ["simple example"]),
+        ("break", ["break"]),
+    ],
+    "RISK": [
+        ("misconception", ["misconception"]),
+    ],
+}
+
+
+def _slot_for(archetype: str, question: str) -> str:
+    ql = (question or "").lower()
+    for slot, needles in SLOT_RULES.get(archetype, []):
+        if any(n in ql for n in needles):
+            return slot
+    return "default"
+
+
 # -----------------------------
 # Question generation
 # -----------------------------
 def build_categories(topic: str, topic_type: str) -> Dict[str, List[str]]:
-    t = topic
     return {
-        "What": [
-            f"What is {t} in plain language?",
-            f"What problem does {t} exist to solve?",
-            f"What are the main benefits of {t}?",
-            f"What are the limitations of {t}?",
-        ],
-        "Why": [
-            f"Why does {t} matter?",
-            f"Why do people get confused about {t}?",
-        ],
-        "How": [
-            f"How does {t} work at a high level?",
-            f"How can I tell if I truly understand {t}?",
-        ],
-        "Where": [
-            f"Where is {t} used in real life?",
-            f"Where does {t} fail or break in practice?",
-        ],
-        "Examples": [
-            f"What is a simple example of {t}?",
-            f"What are real-world examples of {t}?",
-        ],
-        "Misconceptions": [
-            f"What is a common misconception about {t}?",
-        ],
-        "Common Challenges": [
-            f"What challenges do people face when working with {t}?",
-        ],
-        "Related Topics": [
-            f"What topics are closely related to {t}?",
-        ],
+        cat: [topic.join(parts) for parts in templates]
+        for cat, templates in TOPIC_TYPES.question_parts(topic_type).items()
     }
 
 
@@ -199,69 +240,24 @@ def build_categories(topic: str, topic_type: str) -> Dict[str, List[str]]:
 # ORIENT answers
 # (COHESION: define the topic here once; others assume this.)
 # -----------------------------
-def _orient_answer(topic: str, question: str, category: str) -> str:
-    ql = (question or "").lower()
-    core_key = _get_core_key(topic)
-    era = get_era_note(topic)
-
-    # AI cohesive ORIENT
-    if core_key == "artificial intelligence":
-        core = TOPIC_CORE[core_key]
-        one_liner = core["one_liner"]
-
-        if "plain language" in ql:
-            parts = [
-                one_liner,
-                "In practice, AI systems learn from examples (data) and generalize to new inputs.",
-                "They can be powerful, but they are limited by data quality, evaluation, and how they’re used."
-            ]
+def _orient_answer(topic: str, slot: str, core: Core | None, era: str | None) -> str:
+    # Cohesive ORIENT from the topic core
+    if core is not None:
+        orient = core.get("orient", {})
+        if slot in ("plain", "default"):
+            parts = [core["one_liner"]] + list(orient.get(slot, []))
             if era:
                 parts.append(era)
             return "\n\n".join(parts)
 
-        if "problem" in ql:
-            parts = [
-                "AI exists because many real-world tasks are too complex for hand-written rules.",
-                "It helps when you need predictions/decisions/generation based on patterns in large data."
-            ]
+        if slot in orient:
+            parts = list(orient[slot])
             if era:
                 parts.append(era)
             return "\n\n".join(parts)
 
-        if "benefits" in ql:
-            parts = [
-                "Benefits: speed and scale (automation), pattern detection, and decision support.",
-                "It’s most valuable when it augments people and processes—especially with good evaluation."
-            ]
-            if era:
-                parts.append(era)
-            return "\n\n".join(parts)
-
-        if "limitations" in ql:
-            parts = [
-                "Limitations: it can be confidently wrong, inherit bias, and fail when the environment changes (drift).",
-                "You need evaluation, monitoring, and guardrails—especially in high-stakes uses."
-            ]
-            if era:
-                parts.append(era)
-            return "\n\n".join(parts)
-
-        if "confused" in ql:
-            parts = [
-                "People often confuse AI with human understanding or reasoning.",
-                "Most AI is pattern-based: it can look smart without truly understanding."
-            ]
-            if era:
-                parts.append(era)
-            return "\n\n".join(parts)
-
-        parts = [one_liner]
-        if era:
-            parts.append(era)
-        return "\n\n".join(parts)
-
     # Generic ORIENT fallback
-    if "plain language" in ql:
+    if slot == "plain":
         parts = [
             f"{topic} refers to a concept or method people use to solve a problem or achieve a goal.",
             "A good understanding starts with what it is, why it exists, and where it helps in real life."
@@ -270,25 +266,25 @@ def _orient_answer(topic: str, question: str, category: str) -> str:
             parts.append(era)
         return "\n\n".join(parts)
 
-    if "problem" in ql:
+    if slot == "problem":
         return (
             f"{topic} exists to address a real need where simpler approaches fall short.\n\n"
             "Understanding the problem it solves clarifies when it’s useful."
         )
 
-    if "benefits" in ql:
+    if slot == "benefits":
         return (
             f"{topic} can bring speed, clarity, or better outcomes when applied correctly.\n\n"
             "The benefits depend on the context and constraints."
         )
 
-    if "limitations" in ql:
+    if slot == "limitations":
         return (
             f"{topic} has limits and failure modes that matter in practice.\n\n"
             "Knowing where it breaks prevents overconfidence."
         )
 
-    if "confused" in ql:
+    if slot == "confused":
         return (
             f"People get confused about {topic} when they mix it up with similar concepts or skip fundamentals.\n\n"
             "A clear definition plus examples usually fixes it."
@@ -306,24 +302,16 @@ def _orient_answer(topic: str, question: str, category: str) -> str:
 # MECHANISM answers
 # (COHESION: do NOT redefine topic; assume ORIENT already defined it.)
 # -----------------------------
-def _mechanism_answer(topic: str, question: str) -> str:
-    core_key = _get_core_key(topic)
-    ql = (question or "").lower()
-
-    if core_key == "artificial intelligence":
-        core = TOPIC_CORE[core_key]
-
-        if "tell if" in ql or "truly understand" in ql:
-            return "\n\n".join([
-                "Mechanism check (do you really understand it?):",
-                "• what the inputs/outputs are\n• what data it learns from\n• what objective it optimizes\n• how you evaluate it\n• what can make it fail (bias/drift).",
-                "If you can explain the pipeline and how you’d test failures, you understand it."
-            ])
+def _mechanism_answer(topic: str, slot: str, core: Core | None, era: str | None) -> str:
+    if core is not None:
+        if slot == "check" and "mechanism_check" in core:
+            return "\n\n".join(core["mechanism_check"])
 
         # default mechanism
-        parts = ["Mechanism:"]
-        parts.extend(core["mechanism"])
-        return "\n\n".join(parts)
+        if slot != "check" and "mechanism" in core:
+            parts = ["Mechanism:"]
+            parts.extend(core["mechanism"])
+            return "\n\n".join(parts)
 
     # Generic fallback mechanism
     return "\n\n".join([
@@ -337,38 +325,27 @@ def _mechanism_answer(topic: str, question: str) -> str:
 # APPLY answers
 # (COHESION: use core examples; avoid re-definition.)
 # -----------------------------
-def _apply_answer(topic: str, question: str) -> str:
-    core_key = _get_core_key(topic)
-    ql = (question or "").lower()
-
-    if core_key == "artificial intelligence":
-        core = TOPIC_CORE[core_key]
-
-        if "fail" in ql or "break" in ql:
-            return "\n\n".join([
-                "Where it breaks in practice:",
-                "• data drift (the world changes)\n• biased or incomplete data\n• missing evaluation/monitoring\n• using it outside tested scope.",
-                "Most failures happen because humans overtrust outputs without verification."
-            ])
+def _apply_answer(topic: str, slot: str, core: Core | None, era: str | None) -> str:
+    if core is not None:
+        if slot in ("fail", "break") and "apply_fail" in core:
+            return "\n\n".join(core["apply_fail"])
 
-        if "simple example" in ql:
-            return "\n\n".join([
-                "Simple example: spam detection.",
-                "A model learns from labeled emails (spam/not spam) and predicts the label for new emails.",
-                "It works well when training data matches the real inbox and you monitor drift."
-            ])
+        if slot == "simple_example" and "apply_simple_example" in core:
+            return "\n\n".join(core["apply_simple_example"])
 
         # real-world / where used
-        return "Where you see AI in real life:\n\n• " + "\n• ".join(core["apply"])
+        if slot in ("default", "break") and "apply" in core:
+            heading = core.get("apply_heading") or f"Where you see {topic} in real life:"
+            return heading + "\n\n• " + "\n• ".join(core["apply"])
 
     # Generic fallback
-    if "fail" in ql:
+    if slot == "fail":
         return "\n\n".join([
             f"{topic} tends to fail when:",
             "• assumptions don’t hold\n• context changes\n• people skip fundamentals\n• it’s applied outside its intended use."
         ])
 
-    if "simple example" in ql:
+    if slot == "simple_example":
         return "\n\n".join([
             f"Simple example of {topic}:",
             "• One everyday case where it appears.",
@@ -385,26 +362,18 @@ def _apply_answer(topic: str, question: str) -> str:
 # RISK answers
 # (COHESION: use core risk points; corrective, not preachy.)
 # -----------------------------
-def _risk_answer(topic: str, question: str) -> str:
-    core_key = _get_core_key(topic)
-    ql = (question or "").lower()
-
-    if core_key == "artificial intelligence":
-        core = TOPIC_CORE[core_key]
-
-        if "misconception" in ql:
+def _risk_answer(topic: str, slot: str, core: Core | None, era: str | None) -> str:
+    if core is not None:
+        if slot == "misconception" and "misconception" in core:
             # pick the most important misconception first
-            return "\n\n".join([
-                "Common misconception:",
-                "AI 'understands' like a human. It usually doesn’t—it matches patterns.",
-                "This misconception leads to overtrust and missed failure modes."
-            ])
+            return "\n\n".join(core["misconception"])
 
         # challenges/pitfalls
-        return "Common traps:\n\n• " + "\n• ".join(core["risk"])
+        if slot != "misconception" and "risk" in core:
+            return "Common traps:\n\n• " + "\n• ".join(core["risk"])
 
     # Generic fallback
-    if "misconception" in ql:
+    if slot == "misconception":
         return "\n\n".join([
             f"A common misconception about {topic} is assuming it works universally.",
             "Most tools/concepts have a scope where they work well—and places they don’t."
@@ -420,11 +389,8 @@ def _risk_answer(topic: str, question: str) -> str:
 # NEXT answers
 # (COHESION: actionable next steps; consistent voice.)
 # -----------------------------
-def _next_answer(topic: str) -> str:
-    core_key = _get_core_key(topic)
-
-    if core_key == "artificial intelligence":
-        core = TOPIC_CORE[core_key]
+def _next_answer(topic: str, slot: str, core: Core | None, era: str | None) -> str:
+    if core is not None and "next" in core:
         return "Next steps:\n\n• " + "\n• ".join(core["next"])
 
     return "\n\n".join([
@@ -433,36 +399,44 @@ def _next_answer(topic: str) -> str:
     ])
 
 
+def _generic_answer(topic: str, slot: str, core: Core | None, era: str | None) -> str:
+    return f"This question relates to {topic}."
+
+
+ANSWER_GENERATORS = {
+    "ORIENT": _orient_answer,
+    "MECHANISM": _mechanism_answer,
+    "APPLY": _apply_answer,
+    "RISK": _risk_answer,
+    "NEXT": _next_answer,
+}
+
+
+def _qa_id(cat: str, idx: int) -> str:
+    return f"{cat.lower().replace(' ', '_')}_{idx}"
+
+
 # -----------------------------
 # Attach answers
+# (free-form categories; interrogate() uses the precompiled plans below)
 # -----------------------------
 def attach_answers(categories: Dict[str, List[str]], topic: str, topic_type: str):
     out: Dict[str, List[Dict[str, str]]] = {}
+    core_key = _get_core_key(topic)
+    core = KNOWLEDGE.get_core(core_key) if core_key else None
+    era = get_era_note(topic)
 
     for cat, questions in categories.items():
         items = []
+        archetype = ARCHETYPE_MAP.get(cat, "ORIENT")
+        gen = ANSWER_GENERATORS.get(archetype, _generic_answer)
 
         for idx, q in enumerate(questions, start=1):
-            archetype = ARCHETYPE_MAP.get(cat, "ORIENT")
-
-            if archetype == "ORIENT":
-                ans = _orient_answer(topic, q, cat)
-            elif archetype == "MECHANISM":
-                ans = _mechanism_answer(topic, q)
-            elif archetype == "APPLY":
-                ans = _apply_answer(topic, q)
-            elif archetype == "RISK":
-                ans = _risk_answer(topic, q)
-            elif archetype == "NEXT":
-                ans = _next_answer(topic)
-            else:
-                ans = f"This question relates to {topic}."
-
             items.append({
-                "id": f"{cat.lower().replace(' ', '_')}_{idx}",
+                "id": _qa_id(cat, idx),
                 "archetype": archetype,
                 "question": q,
-                "answer": ans,
+                "answer": gen(topic, _slot_for(archetype, q), core, era),
             })
 
         out[cat] = items
@@ -471,23 +445,200 @@ def attach_answers(categories: Dict[str, List[str]], topic: str, topic_type: str
 
 
 # -----------------------------
-# Main interrogate entry
+# Precompiled plans
+# A plan is every question/answer for one (question set, core_key, era
+# note), rendered once with a placeholder topic and split around it. A
+# request only joins the parts with the real topic. Topic types that share
+# a question set share its plans. Generic plans (no core) are compiled at
+# import; core plans on first use, in a bounded LRU.
 # -----------------------------
-def interrogate(text: str) -> Dict[str, object]:
-    clean_topic = extract_topic(text)
-    topic_type, confidence = detect_topic_type(clean_topic)
+_TOPIC_SLOT = "\x00topic\x00"
+PLAN_CACHE_SIZE = 2048
+
+
+class PlanSlot(NamedTuple):
+    id: str
+    archetype: str
+    question: Tuple[str, ...]
+    answer: Tuple[str, ...]
+
 
-    categories = build_categories(clean_topic, topic_type)
-    qa = attach_answers(categories, clean_topic, topic_type)
+Plan = Tuple[Tuple[str, Tuple[PlanSlot, ...]], ...]
+PlanKey = Tuple[int, str | None, str | None]
 
+
+def compile_plan(question_set: int, core_key: str | None, era: str | None) -> Plan:
+    core = KNOWLEDGE.get_core(core_key) if core_key else None
+    plan = []
+    for cat, templates in TOPIC_TYPES.question_sets[question_set].items():
+        archetype = ARCHETYPE_MAP.get(cat, "ORIENT")
+        gen = ANSWER_GENERATORS.get(archetype, _generic_answer)
+        slots = []
+        for idx, (slot, tpl) in enumerate(templates, start=1):
+            slots.append(PlanSlot(
+                id=_qa_id(cat, idx),
+                archetype=archetype,
+                question=tuple(tpl.format(t=_TOPIC_SLOT).split(_TOPIC_SLOT)),
+                answer=tuple(gen(_TOPIC_SLOT, slot, core, era).split(_TOPIC_SLOT)),
+            ))
+        plan.append((cat, tuple(slots)))
+    return tuple(plan)
+
+
+def compile_plans() -> Dict[PlanKey, Plan]:
+    eras = [None] + list(dict.fromkeys(ERA_HOOKS.values()))
     return {
+        (qs, None, era): compile_plan(qs, None, era)
+        for qs in range(len(TOPIC_TYPES.question_sets))
+        for era in eras
+    }
+
+
+PLANS: Dict[PlanKey, Plan] = compile_plans()
+_core_plan = lru_cache(maxsize=PLAN_CACHE_SIZE)(compile_plan)
+
+
+def get_plan(topic: str, topic_type: str) -> Plan:
+    key = (TOPIC_TYPES.question_set_id(topic_type), _get_core_key(topic), get_era_note(topic))
+    plan = PLANS.get(key)
+    if plan is None:
+        plan = _core_plan(*key)
+    return plan
+
+
+def iter_plan(plan: Plan, topic: str, answers: bool = True) -> Iterator[Tuple[str, List[Dict[str, str]]]]:
+    fill = topic.join
+    for cat, slots in plan:
+        if answers:
+            yield cat, [
+                {
+                    "id": s.id,
+                    "archetype": s.archetype,
+                    "question": fill(s.question),
+                    "answer": fill(s.answer),
+                }
+                for s in slots
+            ]
+        else:
+            yield cat, [{"id": s.id, "archetype": s.archetype, "question": fill(s.question)} for s in slots]
+
+
+def select_plan(plan: Plan, mask: FieldMask | None) -> Plan:
+    """The part of `plan` a field mask asks for; empty categories are dropped."""
+    if mask is None:
+        return plan
+    out = []
+    for cat, slots in plan:
+        if mask.categories is not None and cat not in mask.categories:
+            continue
+        if mask.archetypes is not None:
+            slots = tuple(s for s in slots if s.archetype in mask.archetypes)
+        if mask.limit is not None:
+            slots = slots[:mask.limit]
+        if slots:
+            out.append((cat, slots))
+    return tuple(out)
+
+
+def render_plan(plan: Plan, topic: str, answers: bool = True) -> Dict[str, List[Dict[str, str]]]:
+    return dict(iter_plan(plan, topic, answers))
+
+
+def find_slot(plan: Plan, question_id: str) -> PlanSlot | None:
+    for _, slots in plan:
+        for s in slots:
+            if s.id == question_id:
+                return s
+    return None
+
+
+# -----------------------------
+# Main interrogate entry
+# -----------------------------
+INTERROGATE_NOTES = (
+    "v0: template-based interrogation",
+    "v0: cohesion pass for AI via TOPIC_CORE (consistent ORIENT→NEXT flow).",
+)
+
+
+def interrogate(text: str, answers: bool = True) -> Dict[str, object]:
+    return interrogate_analysis(analyze_topic(text), answers)
+
+
+def interrogate_analysis(
+    analysis: TopicAnalysis,
+    answers: bool = True,
+    mask: FieldMask | None = None,
+) -> Dict[str, object]:
+    """
+    answers=False returns ids + questions only; fetch each answer on demand
+    with answer_question(). `mask` limits which questions are rendered and
+    whether the summary is built.
+    """
+    clean_topic, topic_type, confidence, _ = analysis
+
+    with stage("build_categories"):
+        plan = select_plan(get_plan(clean_topic, topic_type), mask)
+    with stage("attach_answers"):
+        qa = render_plan(plan, clean_topic, answers)
+
+    out = {
         "topic": clean_topic,
         "topic_type": topic_type,
         "categories": qa,
-        "summary": build_summary(clean_topic, topic_type, confidence),
+    }
+    if mask is None or mask.summary:
+        out["summary"] = build_summary(clean_topic, topic_type, confidence)
+    out["confidence"] = confidence
+    out["notes"] = list(INTERROGATE_NOTES)
+    return out
+
+
+def interrogate_questions_analysis(analysis: TopicAnalysis, mask: FieldMask | None = None) -> Dict[str, object]:
+    return interrogate_analysis(analysis, answers=False, mask=mask)
+
+
+def iter_interrogation(analysis: TopicAnalysis, answers: bool = True) -> Iterator[Dict[str, object]]:
+    """
+    Streaming form of interrogate_analysis():
+    a "meta" event (topic, type, summary), one "category" event per
+    category as soon as it is rendered, then "done" with the notes.
+    """
+    clean_topic, topic_type, confidence, _ = analysis
+
+    yield {
+        "event": "meta",
+        "topic": clean_topic,
+        "topic_type": topic_type,
         "confidence": confidence,
-        "notes": [
-            "v0: template-based interrogation",
-            "v0: cohesion pass for AI via TOPIC_CORE (consistent ORIENT→NEXT flow).",
-        ],
+        "summary": build_summary(clean_topic, topic_type, confidence),
+    }
+
+    with stage("build_categories"):
+        plan = get_plan(clean_topic, topic_type)
+
+    for cat, items in iter_plan(plan, clean_topic, answers):
+        yield {"event": "category", "name": cat, "items": items}
+
+    yield {"event": "done", "notes": list(INTERROGATE_NOTES)}
+
+
+def question_ids(analysis: TopicAnalysis) -> List[str]:
+    """Question ids for a topic, in display order."""
+    plan = get_plan(analysis.topic, analysis.topic_type)
+    return [s.id for _, slots in plan for s in slots]
+
+
+def answer_question(analysis: TopicAnalysis, question_id: str) -> Dict[str, str] | None:
+    """Single answer for one question id, or None if the id is unknown."""
+    topic = analysis.topic
+    s = find_slot(get_plan(topic, analysis.topic_type), question_id)
+    if s is None:
+        return None
+    return {
+        "topic": topic,
+        "id": s.id,
+        "archetype": s.archetype,
+        "question": topic.join(s.question),
+        "answer": topic.join(s.answer),
     }
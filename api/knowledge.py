@@ -0,0 +1,234 @@
+# api/knowledge.py
+#
+# Topic-core knowledge store.
+# Cores are looked up by alias and loaded one at a time on first use, so
+# import time and RSS do not grow with the corpus.
+#
+#   python -m api.knowledge build --out knowledge.sqlite [--source cores.json]
+#
+# Point the API at a built store with INI_KNOWLEDGE_DB=/path/knowledge.sqlite;
+# without it the in-code TOPIC_CORE seed is used.
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+
+CORE_CACHE_SIZE = 1024
+ALIAS_CACHE_SIZE = 4096
+
+
+def normalize_alias(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _word_ngrams(words: List[str], max_words: int) -> Iterable[Tuple[int, str]]:
+    for n in range(min(max_words, len(words)), 0, -1):
+        for i in range(len(words) - n + 1):
+            yield n, " ".join(words[i:i + n])
+
+
+def _core_aliases(key: str, core: Dict[str, object]) -> Tuple[List[str], List[str]]:
+    aliases = core.get("aliases") or {}
+    exact = [normalize_alias(a) for a in aliases.get("exact", [])]
+    contains = [normalize_alias(a) for a in aliases.get("contains", [key])]
+    return exact, contains
+
+
+def cores_fingerprint(cores: Dict[str, Dict[str, object]]) -> str:
+    blob = json.dumps(cores, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+# -----------------------------
+# In-code store (seed / fallback)
+# -----------------------------
+class DictKnowledgeStore:
+    def __init__(self, cores: Dict[str, Dict[str, object]]):
+        self._cores = cores
+        self._exact: Dict[str, str] = {}
+        self._contains: Dict[str, str] = {}
+        for key, core in cores.items():
+            exact, contains = _core_aliases(key, core)
+            for a in exact:
+                self._exact.setdefault(a, key)
+            for a in contains:
+                self._contains.setdefault(a, key)
+        self._max_words = max((len(a.split()) for a in self._contains), default=0)
+        # Every engine call on a topic looks up its key; the n-gram scan is
+        # linear in topic length, so remember the answer per topic.
+        self.core_key_for = lru_cache(maxsize=ALIAS_CACHE_SIZE)(self._lookup_key)
+
+    def fingerprint(self) -> str:
+        return cores_fingerprint(self._cores)
+
+    def keys(self) -> List[str]:
+        return list(self._cores)
+
+    def _lookup_key(self, topic: str) -> str | None:
+        tl = normalize_alias(topic)
+        hit = self._exact.get(tl)
+        if hit is not None:
+            return hit
+        # Longest alias wins, then leftmost.
+        for _, gram in _word_ngrams(tl.split(), self._max_words):
+            hit = self._contains.get(gram)
+            if hit is not None:
+                return hit
+        return None
+
+    def get_core(self, key: str) -> Dict[str, object] | None:
+        return self._cores.get(key)
+
+
+# -----------------------------
+# SQLite store (read-only, memory-mapped)
+# -----------------------------
+_SCHEMA = """
+CREATE TABLE cores (key TEXT PRIMARY KEY, body TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE aliases (
+    alias TEXT NOT NULL,
+    mode TEXT NOT NULL CHECK (mode IN ('exact', 'contains')),
+    key TEXT NOT NULL,
+    PRIMARY KEY (mode, alias)
+) WITHOUT ROWID;
+CREATE TABLE meta (name TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+"""
+
+
+class SqliteKnowledgeStore:
+    """
+    Cores and aliases in a SQLite file opened read-only with mmap.
+    Alias lookups hit the primary-key index (O(log n)); core bodies are
+    decoded on demand and kept in a bounded LRU.
+    """
+
+    def __init__(self, path: str, mmap_bytes: int = 256 * 1024 * 1024):
+        self.path = path
+        self._mmap_bytes = mmap_bytes
+        self._local = threading.local()
+        meta = dict(self._conn().execute("SELECT name, value FROM meta"))
+        self._fingerprint = meta.get("fingerprint", "")
+        self._max_words = int(meta.get("max_contains_words", "0"))
+        self.get_core = lru_cache(maxsize=CORE_CACHE_SIZE)(self._load_core)
+        self.core_key_for = lru_cache(maxsize=ALIAS_CACHE_SIZE)(self._lookup_key)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            conn.execute(f"PRAGMA mmap_size={int(self._mmap_bytes)}")
+            self._local.conn = conn
+        return conn
+
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    def keys(self) -> List[str]:
+        return [k for (k,) in self._conn().execute("SELECT key FROM cores ORDER BY key")]
+
+    def _lookup_key(self, topic: str) -> str | None:
+        tl = normalize_alias(topic)
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT key FROM aliases WHERE mode = 'exact' AND alias = ?", (tl,)
+        ).fetchone()
+        if row:
+            return row[0]
+
+        grams = list(_word_ngrams(tl.split(), self._max_words))
+        if not grams:
+            return None
+        marks = ",".join("?" * len(grams))
+        found = dict(conn.execute(
+            f"SELECT alias, key FROM aliases WHERE mode = 'contains' AND alias IN ({marks})",
+            [g for _, g in grams],
+        ))
+        # Same precedence as DictKnowledgeStore: longest alias, then leftmost.
+        for _, gram in grams:
+            if gram in found:
+                return found[gram]
+        return None
+
+    def _load_core(self, key: str) -> Dict[str, object] | None:
+        row = self._conn().execute("SELECT body FROM cores WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+
+def build_store(cores: Dict[str, Dict[str, object]], path: str) -> None:
+    """Write cores (key -> core dict, optional "aliases") to a fresh SQLite store."""
+    tmp = f"{path}.tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+
+    conn = sqlite3.connect(tmp)
+    try:
+        conn.executescript(_SCHEMA)
+        max_words = 0
+        for key, core in cores.items():
+            conn.execute(
+                "INSERT INTO cores (key, body) VALUES (?, ?)",
+                (key, json.dumps(core, ensure_ascii=False, separators=(",", ":"))),
+            )
+            exact, contains = _core_aliases(key, core)
+            conn.executemany(
+                "INSERT OR IGNORE INTO aliases (alias, mode, key) VALUES (?, 'exact', ?)",
+                [(a, key) for a in exact],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO aliases (alias, mode, key) VALUES (?, 'contains', ?)",
+                [(a, key) for a in contains],
+            )
+            max_words = max([max_words] + [len(a.split()) for a in contains])
+        conn.executemany(
+            "INSERT INTO meta (name, value) VALUES (?, ?)",
+            [
+                ("fingerprint", cores_fingerprint(cores)),
+                ("max_contains_words", str(max_words)),
+                ("count", str(len(cores))),
+            ],
+        )
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    os.replace(tmp, path)
+
+
+def open_knowledge_store(seed: Dict[str, Dict[str, object]]):
+    path = os.getenv("INI_KNOWLEDGE_DB")
+    if not path:
+        return DictKnowledgeStore(seed)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"INI_KNOWLEDGE_DB not found: {path}")
+    return SqliteKnowledgeStore(path)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m api.knowledge")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="build a SQLite knowledge store")
+    b.add_argument("--out", required=True)
+    b.add_argument("--source", help="JSON file {key: core}; defaults to the in-code TOPIC_CORE")
+    args = parser.parse_args(argv)
+
+    if args.source:
+        with open(args.source, encoding="utf-8") as f:
+            cores = json.load(f)
+    else:
+        from api.interrogate import TOPIC_CORE
+        cores = TOPIC_CORE
+
+    build_store(cores, args.out)
+    print(f"wrote {len(cores)} cores to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
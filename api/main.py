@@ -1,44 +1,404 @@
-from fastapi import FastAPI
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Dict, List, Literal, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel
-from api.interrogate import interrogate
-from api.illustrate import illustrate as illustrate_logic
+from starlette.concurrency import run_in_threadpool
 from api.resume import resume as resume_logic
+from api.batch import MAX_BATCH_TOPICS, iter_batch_ndjson, ndjson_line
+from api.cache import RESPONSE_CACHE, cached_engine
+from api.executor import ENGINE_POOL, Overloaded
+from api.explore import explore_header, explore_supports, validate_sections
+from api.masks import make_mask
+from api.metrics import (
+    METRICS_ENABLED,
+    REQUEST_SECONDS,
+    REQUESTS_TOTAL,
+    begin_request,
+    end_request,
+    render_prometheus,
+    sample_lines,
+    server_timing_header,
+)
+from api.responses import BufferResponse, FAST_JSON, FastJSONResponse, StaticJSON, TimedJSONResponse, dumps
+from api.compression import COMPRESSED_CACHE, encoded_body, negotiate
+from api.engines import (
+    ENGINE_SPECS,
+    ENGINES,
+    WARMUP,
+    LazyFunction,
+    analyze_topic,
+    answer_question,
+    iter_interrogation,
+    question_ids,
+    warm_up,
+    warm_up_in_background,
+)
+from api.bundle import BUNDLE
+from api.sessions import SESSION_STORE
+from api.singleflight import ASYNC_ENGINE_FLIGHTS, ENGINE_FLIGHTS
+
+
+# Engine loading: "background" (default) starts serving right away and loads
+# engines in a thread; "startup" loads them before accepting requests;
+# "off" loads each engine on its first request.
+WARMUP_MODE = os.getenv("INI_WARMUP", "background")
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if WARMUP_MODE == "background":
+        warm_up_in_background()
+    elif WARMUP_MODE == "startup":
+        warm_up()
+    await run_in_threadpool(SESSION_STORE.open)
+    try:
+        yield
+    finally:
+        ENGINE_POOL.shutdown()
+        SESSION_STORE.close()
 
 
-app = FastAPI()
+app = FastAPI(default_response_class=TimedJSONResponse, lifespan=lifespan)
+
+if METRICS_ENABLED:
+    @app.middleware("http")
+    async def timing_middleware(request: Request, call_next):
+        token = begin_request()
+        start = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            stages = end_request(token)
+        total = time.perf_counter() - start
+
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        REQUEST_SECONDS.observe(total, route=path)
+        REQUESTS_TOTAL.inc(route=path, method=request.method, status=str(response.status_code))
+        response.headers["Server-Timing"] = server_timing_header(stages, total)
+        return response
+
+CACHED_ENGINES = {name: cached_engine(name, LazyFunction(spec)) for name, spec in ENGINE_SPECS.items()}
 
 class TopicIn(BaseModel):
     topic: str
 
+class TopicsIn(BaseModel):
+    topics: List[str]
+
+class ResumeIn(BaseModel):
+    session_id: Optional[str] = None
+
+class ProgressIn(BaseModel):
+    session_id: str
+    topic: Optional[str] = None
+    question_ids: Optional[List[str]] = None
+    viewed: List[str] = []
+    open: Optional[List[str]] = None
+    seq: Optional[int] = None  # client counter; older updates are dropped
+
+class ExploreIn(BaseModel):
+    topic: str
+    sections: Optional[List[str]] = None
+    answers: bool = True
+
+
+# Static payloads: serialized once, served as bytes.
+ROOT_PAYLOAD = StaticJSON({"message": "InI engine is alive"})
+HEALTH_PAYLOAD = StaticJSON({
+    "status": "ok",
+    "service": "InI.ai",
+    "version": "0.1",
+    "components": [
+        "interrogate",
+        "illustrate",
+        "resume"
+    ]
+})
+RESUME_PAYLOAD = StaticJSON(resume_logic())
+
+
+def _json(result, headers: Dict[str, str] | None = None):
+    """Dynamic payloads: skip jsonable_encoder when INI_FAST_JSON=1."""
+    if FAST_JSON:
+        return FastJSONResponse(result, headers=headers)
+    if headers:
+        return TimedJSONResponse(jsonable_encoder(result), headers=headers)
+    return result
+
+
+def _negotiated_headers(used: str | None) -> Dict[str, str]:
+    """Every negotiated body varies on Accept-Encoding, identity included."""
+    headers = {"Vary": "Accept-Encoding"}
+    if used:
+        headers["Content-Encoding"] = used
+    return headers
+
+
+def _key(name: str, analysis, mask=None) -> tuple:
+    """Cache / coalescing key; masked responses are cached separately."""
+    return (name, analysis.key) if mask is None else (name, analysis.key, mask)
+
+
+async def _cache_get(key):
+    if not RESPONSE_CACHE.enabled:
+        return None
+    if RESPONSE_CACHE.blocking:
+        return await run_in_threadpool(RESPONSE_CACHE.get, key)
+    return RESPONSE_CACHE.get(key)
+
+
+async def _cache_put(key, result) -> None:
+    if RESPONSE_CACHE.blocking:
+        await run_in_threadpool(RESPONSE_CACHE.put, key, result)
+    else:
+        RESPONSE_CACHE.put(key, result)
+
+
+async def run_engine(name: str, analysis, mask=None):
+    """
+    Cache hits return inline on the event loop (in a thread for the
+    SQLite backend); misses go to ENGINE_POOL, with concurrent misses for
+    one key sharing a single computation. A full pool answers 503 right away.
+    """
+    key = _key(name, analysis, mask)
+    result = await _cache_get(key)
+    if result is None:
+        try:
+            result = await ASYNC_ENGINE_FLIGHTS.do(key, lambda: _compute(key, name, analysis, mask))
+        except Overloaded:
+            raise HTTPException(
+                status_code=503,
+                detail="Engine pool is busy, retry shortly.",
+                headers={"Retry-After": "1"},
+            )
+    return result
+
+
+async def _compute(key, name: str, analysis, mask):
+    engine = ENGINES[name] if mask is None else partial(ENGINES[name], mask=mask)
+    result = await ENGINE_POOL.run(engine, analysis)
+    await _cache_put(key, result)
+    return result
+
+
+async def engine_response(request: Request, name: str, analysis, mask=None):
+    """
+    run_engine() plus Accept-Encoding negotiation. Compressed bodies are
+    cached per (engine, topic, encoding), so repeat hot topics cost no
+    serialization or compression CPU. Topics in the precomputed bundle
+    are served straight from its mapping.
+    """
+    encoding = negotiate(request.headers.get("accept-encoding"))
+    if BUNDLE is not None and mask is None:
+        hit = BUNDLE.body(name, analysis.key, encoding)
+        if hit is not None:
+            used, body = hit
+            return BufferResponse(content=body, media_type="application/json", headers=_negotiated_headers(used))
+
+    result = await run_engine(name, analysis, mask)
+    if encoding is None:
+        return _json(result, headers=_negotiated_headers(None))
+
+    args = (_key(name, analysis, mask), encoding, lambda: dumps(result))
+    if COMPRESSED_CACHE.blocking:
+        used, body = await run_in_threadpool(encoded_body, *args)
+    else:
+        used, body = encoded_body(*args)
+    return Response(content=body, media_type="application/json", headers=_negotiated_headers(used))
+
+
+def _mask(**fields):
+    try:
+        return make_mask(**fields)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def _batch_response(payload: TopicsIn, engine) -> StreamingResponse:
+    if len(payload.topics) > MAX_BATCH_TOPICS:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_TOPICS} topics per batch.")
+    return StreamingResponse(
+        iter_batch_ndjson(payload.topics, engine),
+        media_type="application/x-ndjson",
+    )
+
 @app.get("/")
-def root():
-    return {"message": "InI engine is alive"}
+async def root():
+    return ROOT_PAYLOAD.response()
 
 @app.post("/interrogate")
-def interrogate_route(payload: TopicIn):
-    return interrogate(payload.topic)
+async def interrogate_route(
+    payload: TopicIn,
+    request: Request,
+    answers: bool = True,
+    format: Literal["full", "compact"] = "full",
+    categories: Optional[List[str]] = Query(None),
+    archetypes: Optional[List[str]] = Query(None),
+    limit: Optional[int] = None,
+    summary: bool = True,
+):
+    """
+    Field masks: `categories` / `archetypes` (repeatable) and `limit` (per
+    category) pick which questions are generated; `summary=false` skips
+    the summary block.
+    """
+    mask = _mask(categories=categories, archetypes=archetypes, limit=limit, summary=summary)
+    name = "interrogate" if answers else "interrogate_questions"
+    if format == "compact":
+        name += "_compact"
+    return await engine_response(request, name, analyze_topic(payload.topic), mask)
+
+@app.post("/interrogate/stream")
+def interrogate_stream_route(payload: TopicIn, answers: bool = True):
+    events = iter_interrogation(analyze_topic(payload.topic), answers)
+    return StreamingResponse(
+        (ndjson_line(e) for e in events),
+        media_type="application/x-ndjson",
+    )
+
+@app.get("/answer/{topic:path}/{question_id}")
+def answer_route(topic: str, question_id: str):
+    item = answer_question(analyze_topic(topic), question_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail=f"Unknown question id: {question_id}")
+    return _json(item)
 
 @app.post("/illustrate")
-def illustrate_route(payload: TopicIn):
-    return illustrate_logic(payload.topic)
+async def illustrate_route(
+    payload: TopicIn,
+    request: Request,
+    limit: Optional[int] = None,
+    supports: bool = True,
+):
+    """`limit` caps the number of illustrations; `supports=false` skips the support map."""
+    mask = _mask(limit=limit, supports=supports)
+    return await engine_response(request, "illustrate", analyze_topic(payload.topic), mask)
+
+@app.post("/explore")
+async def explore_route(payload: ExploreIn):
+    """
+    Interrogation, illustration and support mapping from one topic analysis.
+    `sections` picks any of interrogation / illustration / supports (default: all).
+    """
+    try:
+        sections = validate_sections(payload.sections)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    analysis = analyze_topic(payload.topic)
+    out = explore_header(analysis)
+
+    jobs = {}
+    if "interrogation" in sections:
+        jobs["interrogation"] = run_engine("interrogate" if payload.answers else "interrogate_questions", analysis)
+    if "illustration" in sections:
+        jobs["illustration"] = run_engine("illustrate", analysis)
+    for section, result in zip(jobs, await asyncio.gather(*jobs.values())):
+        out[section] = result
+
+    if "supports" in sections:
+        out["supports"] = explore_supports(analysis)
+    return _json(out)
+
+@app.post("/interrogate/batch")
+def interrogate_batch_route(payload: TopicsIn):
+    return _batch_response(payload, CACHED_ENGINES["interrogate"])
+
+@app.post("/illustrate/batch")
+def illustrate_batch_route(payload: TopicsIn):
+    return _batch_response(payload, CACHED_ENGINES["illustrate"])
 
 
 @app.post("/resume")
-def resume_route():
-    return resume_logic()
+async def resume_route(payload: Optional[ResumeIn] = None):
+    """Generic checklist; with a session_id, also that learner's last topic and unviewed questions."""
+    if payload is None or not payload.session_id:
+        return RESUME_PAYLOAD.response()
+    session = await run_in_threadpool(SESSION_STORE.get, payload.session_id)
+    return _json(resume_logic(session))
 
 
+@app.post("/progress")
+async def progress_route(payload: ProgressIn):
+    """
+    Record a learner's progress: a new topic (question ids default to the
+    topic's interrogation order), questions just viewed, and open answers.
+    """
+    topic, ids = None, payload.question_ids
+    if payload.topic is not None:
+        analysis = analyze_topic(payload.topic)
+        topic = analysis.topic
+        if ids is None:
+            ids = question_ids(analysis)
+    return _json(await run_in_threadpool(
+        SESSION_STORE.record,
+        payload.session_id,
+        topic=topic,
+        question_ids=ids,
+        viewed=payload.viewed,
+        open_ids=payload.open,
+        seq=payload.seq,
+    ))
 
-@app.get("/health")
-def health():
+
+@app.get("/sessions/stats")
+def sessions_stats():
+    return SESSION_STORE.stats()
+
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    return RESPONSE_CACHE.stats()
+
+
+@app.get("/engine/stats")
+def engine_stats():
     return {
-        "status": "ok",
-        "service": "InI.ai",
-        "version": "0.1",
-        "components": [
-            "interrogate",
-            "illustrate",
-            "resume"
-        ]
+        **ENGINE_POOL.stats(),
+        "warmup": WARMUP,
+        "loaded_engines": ENGINES.loaded(),
+        "singleflight": {"sync": ENGINE_FLIGHTS.stats(), "async": ASYNC_ENGINE_FLIGHTS.stats()},
     }
+
+
+@app.get("/bundle/stats")
+def bundle_stats():
+    return BUNDLE.stats() if BUNDLE is not None else {"loaded": False}
+
+
+@app.get("/metrics")
+def metrics():
+    if not METRICS_ENABLED:
+        return PlainTextResponse("# metrics disabled; set INI_METRICS=1\n")
+
+    cache = RESPONSE_CACHE.stats()
+    pool = ENGINE_POOL.stats()
+    extra = (
+        sample_lines("ini_cache_events_total", "Response cache lookups and evictions.", "counter", {
+            k: cache[k] for k in ("hits", "misses", "evictions", "expirations", "invalidations")
+        }, label="event")
+        + sample_lines("ini_cache_usage", "Response cache size.", "gauge", {
+            "entries": cache["entries"], "bytes": cache["bytes"],
+        }, label="unit")
+        + sample_lines("ini_engine_pool", "Engine pool load.", "gauge", {
+            "in_flight": pool["in_flight"], "rejected": pool["rejected"],
+        }, label="state")
+    )
+    return PlainTextResponse(
+        render_prometheus(extra),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@app.get("/health")
+async def health():
+    return HEALTH_PAYLOAD.response()
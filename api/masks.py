@@ -0,0 +1,53 @@
+# api/masks.py
+#
+# Field masks: which parts of a response a client wants. Engines use the
+# mask to skip work (unselected categories are never rendered, unrequested
+# illustrations never formatted), not just to trim output.
+
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple, Tuple
+
+
+class FieldMask(NamedTuple):
+    categories: Tuple[str, ...] | None = None  # interrogate: category names
+    archetypes: Tuple[str, ...] | None = None  # interrogate: ORIENT, MECHANISM, ...
+    limit: int | None = None                   # questions per category / illustrations
+    summary: bool = True                       # interrogate: summary block
+    supports: bool = True                      # illustrate: support map
+
+
+def make_mask(
+    categories: Iterable[str] | None = None,
+    archetypes: Iterable[str] | None = None,
+    limit: int | None = None,
+    summary: bool = True,
+    supports: bool = True,
+) -> FieldMask | None:
+    """
+    Validated, canonical mask (hashable; part of cache keys), or None when
+    nothing is masked out. Raises ValueError for unknown names.
+    """
+    from api.interrogate import ARCHETYPE_ORDER
+    from api.topic_types import TOPIC_TYPES
+
+    def pick(wanted: Iterable[str] | None, known, label: str) -> Tuple[str, ...] | None:
+        if wanted is None:
+            return None
+        wanted = set(wanted)
+        unknown = wanted - set(known)
+        if unknown:
+            raise ValueError(f"Unknown {label}: {sorted(unknown)} (expected {list(known)})")
+        return tuple(k for k in known if k in wanted)
+
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be >= 0")
+
+    mask = FieldMask(
+        categories=pick(categories, TOPIC_TYPES.categories, "categories"),
+        archetypes=pick(archetypes, ARCHETYPE_ORDER, "archetypes"),
+        limit=limit,
+        summary=summary,
+        supports=supports,
+    )
+    return None if mask == FieldMask() else mask
@@ -0,0 +1,191 @@
+# api/metrics.py
+#
+# Per-stage timing with Prometheus text exposition and Server-Timing.
+# Disabled unless INI_METRICS=1: stage() then returns a shared no-op
+# context manager and no middleware is installed.
+#
+# Stages are collected per request in a context variable, so they cover
+# the event loop and thread pools. With INI_EXECUTION_MODE=process the
+# engine stages run in child processes: their timings are not recorded.
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import os
+import threading
+import time
+from typing import Dict, List, Sequence, Tuple
+
+
+METRICS_ENABLED = os.getenv("INI_METRICS", "0") == "1"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _fmt_labels(labels: Labels, extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    items = labels + extra
+    if not items:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in items
+    )
+    return "{" + body + "}"
+
+
+def _fmt_value(v: float) -> str:
+    return repr(float(v)) if v != int(v) else str(int(v))
+
+
+# -----------------------------
+# Instruments
+# -----------------------------
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, v in sorted(self._values.items()):
+                lines.append(f"{self.name}{_fmt_labels(labels)} {_fmt_value(v)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        # labels -> [bucket counts..., +Inf count, sum]
+        self._series: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0.0] * (len(self.buckets) + 2)
+            series[idx] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, series in sorted(self._series.items()):
+                cumulative = 0.0
+                for bound, count in zip(self.buckets, series):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_fmt_labels(labels, (('le', repr(bound)),))} {_fmt_value(cumulative)}")
+                cumulative += series[len(self.buckets)]
+                lines.append(f"{self.name}_bucket{_fmt_labels(labels, (('le', '+Inf'),))} {_fmt_value(cumulative)}")
+                lines.append(f"{self.name}_sum{_fmt_labels(labels)} {repr(series[-1])}")
+                lines.append(f"{self.name}_count{_fmt_labels(labels)} {_fmt_value(cumulative)}")
+        return lines
+
+
+STAGE_SECONDS = Histogram("ini_stage_seconds", "Time spent in each pipeline stage.")
+REQUEST_SECONDS = Histogram("ini_http_request_seconds", "End-to-end request latency by route.")
+REQUESTS_TOTAL = Counter("ini_http_requests_total", "Requests by route and status.")
+
+INSTRUMENTS = [STAGE_SECONDS, REQUEST_SECONDS, REQUESTS_TOTAL]
+
+
+# -----------------------------
+# Stage timing
+# -----------------------------
+# Stages recorded during the current request, for the Server-Timing header.
+_request_stages: contextvars.ContextVar[List[Tuple[str, float]] | None] = contextvars.ContextVar(
+    "ini_request_stages", default=None
+)
+
+
+class _Stage:
+    __slots__ = ("name", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self._start
+        STAGE_SECONDS.observe(elapsed, stage=self.name)
+        stages = _request_stages.get()
+        if stages is not None:
+            stages.append((self.name, elapsed))
+        return False
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(name: str):
+    """`with stage("attach_answers"): ...` — a no-op unless metrics are enabled."""
+    if METRICS_ENABLED:
+        return _Stage(name)
+    return _NULL_STAGE
+
+
+def begin_request() -> contextvars.Token:
+    return _request_stages.set([])
+
+
+def end_request(token: contextvars.Token) -> List[Tuple[str, float]]:
+    stages = _request_stages.get() or []
+    _request_stages.reset(token)
+    return stages
+
+
+def server_timing_header(stages: List[Tuple[str, float]], total: float) -> str:
+    merged: Dict[str, float] = {}
+    for name, secs in stages:
+        merged[name] = merged.get(name, 0.0) + secs
+    parts = [f"{name};dur={secs * 1000:.3f}" for name, secs in merged.items()]
+    parts.append(f"total;dur={total * 1000:.3f}")
+    return ", ".join(parts)
+
+
+def render_prometheus(extra_lines: List[str] | None = None) -> str:
+    lines: List[str] = []
+    for inst in INSTRUMENTS:
+        lines.extend(inst.render())
+    if extra_lines:
+        lines.extend(extra_lines)
+    return "\n".join(lines) + "\n"
+
+
+def sample_lines(name: str, help_text: str, kind: str, values: Dict[str, float], label: str = "name") -> List[str]:
+    """Exposition lines for values read at scrape time (e.g. cache stats)."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    for key, v in values.items():
+        lines.append(f"{name}{_fmt_labels(((label, key),))} {_fmt_value(v)}")
+    return lines
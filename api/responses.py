@@ -0,0 +1,64 @@
+# api/responses.py
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+
+from api.metrics import stage
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+
+# Opt-in: return dynamic payloads as FastJSONResponse (skips jsonable_encoder).
+FAST_JSON = os.getenv("INI_FAST_JSON", "0") == "1"
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON; orjson when installed, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class TimedJSONResponse(JSONResponse):
+    def render(self, content) -> bytes:
+        with stage("serialize"):
+            return super().render(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response for plain dict/list/str/number payloads.
+    Return it directly from a route so FastAPI skips jsonable_encoder.
+    """
+
+    def render(self, content) -> bytes:
+        with stage("serialize"):
+            return dumps(content)
+
+
+class StaticJSON:
+    """A payload serialized once at startup and served as bytes."""
+
+    def __init__(self, content: Any):
+        self.body = dumps(content)
+
+    def response(self) -> Response:
+        return Response(content=self.body, media_type="application/json")
+
+
+class BufferResponse(Response):
+    """
+    Response whose body is any bytes-like buffer (e.g. a memoryview slice of
+    an mmap). Sent as-is, without copying into a new bytes object.
+    """
+
+    def render(self, content) -> Any:
+        return content
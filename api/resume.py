@@ -4,11 +4,12 @@ from __future__ import annotations
 from typing import Dict, List
 
 
-def resume() -> Dict[str, object]:
+def resume(session: Dict[str, object] | None = None) -> Dict[str, object]:
     """
     v0 Resume intelligence.
     Guides a user on how to continue work after a pause.
-    This is deterministic and project-aware (not user-aware yet).
+    Project-aware; with `session` (see api/sessions.py) also picks up the
+    learner's last topic and unviewed questions.
     """
 
     steps: List[str] = [
@@ -33,10 +34,9 @@ def resume() -> Dict[str, object]:
     next_tasks: List[str] = [
         "Improve interrogation intelligence (topic-type detection).",
         "Refine illustration structure.",
-        "Add persistence (remember last topic or state).",
     ]
 
-    return {
+    out = {
         "status": "resume-ready",
         "steps": steps,
         "commands": commands,
@@ -44,6 +44,12 @@ def resume() -> Dict[str, object]:
         "next_tasks": next_tasks,
         "notes": [
             "v0 resume logic is generic.",
-            "Later versions can be user-specific and state-aware.",
+            "Send a session_id to resume a learner's own progress.",
         ],
     }
+    if session is not None:
+        out["session"] = session
+        if session.get("topic"):
+            left = len(session.get("unviewed", []))
+            out["steps"] = [f"Continue with '{session['topic']}': {left} question(s) not viewed yet."] + steps
+    return out
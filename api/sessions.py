@@ -0,0 +1,214 @@
+# api/sessions.py
+#
+# Learner progress (last topic, viewed / open questions) per session id.
+#
+# State lives in one SQLite file in WAL mode (INI_SESSIONS_DIR/sessions.sqlite),
+# so every uvicorn worker on the host reads and writes the same sessions:
+# progress posted to one worker is what /resume returns on another. Each
+# update is a short read-modify-write transaction; readers never block.
+#
+# Durability: synchronous=NORMAL, so a committed update survives a process
+# crash; an OS crash can lose the updates since the last WAL checkpoint.
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List
+
+DB_FILE = "sessions.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    seq INTEGER,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class _Session:
+    __slots__ = ("topic", "unviewed", "viewed", "open", "updated_at")
+
+    def __init__(self):
+        self.topic: str | None = None
+        # Insertion-ordered: question order is kept, removal is O(1).
+        self.unviewed: Dict[str, None] = {}
+        self.viewed: Dict[str, None] = {}
+        self.open: List[str] = []
+        self.updated_at = 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "topic": self.topic,
+            "unviewed": list(self.unviewed),
+            "viewed": list(self.viewed),
+            "open": list(self.open),
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, object]) -> "_Session":
+        s = cls()
+        s.topic = d.get("topic")
+        s.unviewed = dict.fromkeys(d.get("unviewed", ()))
+        s.viewed = dict.fromkeys(d.get("viewed", ()))
+        s.open = list(d.get("open", ()))
+        s.updated_at = d.get("updated_at", 0.0)
+        return s
+
+
+def _apply(s: _Session, rec: Dict[str, object]) -> None:
+    """
+    One update. Fields (all optional besides ts):
+      t: topic; a new topic resets progress.   q: question ids for the topic.
+      v: ids just viewed.                      o: ids currently open (replaces).
+    """
+    topic = rec.get("t")
+    if topic is not None and topic != s.topic:
+        s.topic = topic
+        s.unviewed, s.viewed, s.open = {}, {}, []
+    if rec.get("q") is not None:
+        s.unviewed = {qid: None for qid in rec["q"] if qid not in s.viewed}
+    for qid in rec.get("v", ()):
+        s.unviewed.pop(qid, None)
+        s.viewed[qid] = None
+    if rec.get("o") is not None:
+        s.open = list(rec["o"])
+    s.updated_at = rec["ts"]
+
+
+class SessionStore:
+    """
+    Session state shared by every process using the same directory.
+    Connections are per thread; the file is created by open(), or on first
+    use.
+    """
+
+    # Calls do file I/O and may wait on other workers' writes (up to the
+    # 5 s busy timeout): async code must run them in a thread.
+    blocking = True
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.path = os.path.join(directory, DB_FILE)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._conns: List[sqlite3.Connection] = []
+        self._ready = False
+        self.records = 0
+        self.stale = 0
+
+    @classmethod
+    def from_env(cls) -> "SessionStore":
+        return cls(directory=os.getenv("INI_SESSIONS_DIR", ".ini-sessions"))
+
+    # -----------------------------
+    # Open / close
+    # -----------------------------
+    def open(self) -> None:
+        """Create the directory and schema; safe to call from every worker."""
+        if self._ready:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._connect().executescript(_SCHEMA)
+        self._ready = True
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._conns.append(conn)
+        return conn
+
+    def _conn(self) -> sqlite3.Connection:
+        if not self._ready:
+            self.open()
+        return self._connect()
+
+    def close(self) -> None:
+        with self._lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            conn.close()
+        self._local = threading.local()
+        self._ready = False
+
+    # -----------------------------
+    # Reads / writes
+    # -----------------------------
+    def record(
+        self,
+        session_id: str,
+        topic: str | None = None,
+        question_ids: Iterable[str] | None = None,
+        viewed: Iterable[str] = (),
+        open_ids: Iterable[str] | None = None,
+        seq: int | None = None,
+    ) -> Dict[str, object]:
+        """
+        Apply one progress update atomically. Returns the new state.
+        `seq` is the client's own increasing counter: an update that arrives
+        after a later one from the same session is dropped, not applied.
+        """
+        rec: Dict[str, object] = {"ts": time.time()}
+        if topic is not None:
+            rec["t"] = topic
+        if question_ids is not None:
+            rec["q"] = list(question_ids)
+        rec["v"] = list(viewed)
+        if open_ids is not None:
+            rec["o"] = list(open_ids)
+
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT state, seq FROM sessions WHERE id = ?", (session_id,)).fetchone()
+            last_seq = row[1] if row else None
+            if seq is not None and last_seq is not None and seq <= last_seq:
+                conn.execute("COMMIT")
+                self.stale += 1
+                return json.loads(row[0])
+            s = _Session.from_dict(json.loads(row[0])) if row else _Session()
+            _apply(s, rec)
+            state = s.to_dict()
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (id, state, seq, updated_at) VALUES (?, ?, ?, ?)",
+                (
+                    session_id,
+                    json.dumps(state, ensure_ascii=False, separators=(",", ":")),
+                    last_seq if seq is None else seq,
+                    s.updated_at,
+                ),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self.records += 1
+        return state
+
+    def get(self, session_id: str) -> Dict[str, object] | None:
+        row = self._conn().execute("SELECT state FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def stats(self) -> Dict[str, object]:
+        (count,) = self._conn().execute("SELECT COUNT(*) FROM sessions").fetchone()
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "sessions": count,
+            "records": self.records,  # this worker's
+            "stale": self.stale,
+        }
+
+
+SESSION_STORE = SessionStore.from_env()
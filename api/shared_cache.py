@@ -0,0 +1,269 @@
+# api/shared_cache.py
+#
+# Host-wide response cache shared by every uvicorn worker.
+# Backed by one SQLite file in WAL mode: readers never block each other,
+# and a result computed by one worker is a hit for all of them.
+#
+# Select it with INI_CACHE_BACKEND=sqlite (path: INI_SHARED_CACHE_PATH,
+# default: a 0700 directory of this user's under the temp dir).
+#
+# Values are stored as JSON, never pickles: engine dicts, plus
+# (label, bytes) pairs from the compressed cache, whose bytes go in a BLOB
+# column. A file owned by another user is refused.
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+from typing import Callable, Dict, Hashable, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries_v2 (
+    ns TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    body BLOB,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (ns, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_v2_lru ON entries_v2 (ns, accessed_at);
+"""
+
+
+def _check_owner(path: str, st: os.stat_result) -> None:
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by another user; refusing to use it as a cache")
+
+
+def default_path() -> str:
+    """Cache file in a private (0700) per-user directory under the temp dir."""
+    uid = os.getuid() if hasattr(os, "getuid") else os.getpid()
+    directory = os.path.join(tempfile.gettempdir(), f"ini-ai-{uid}")
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode):
+        raise PermissionError(f"{directory} is not a directory; refusing to use it for the cache")
+    _check_owner(directory, st)
+    if st.st_mode & 0o077:
+        raise PermissionError(f"{directory} is accessible to other users (mode {st.st_mode & 0o777:o})")
+    return os.path.join(directory, "cache.sqlite")
+
+
+def encode_value(value: object) -> Tuple[str, bytes | None]:
+    """(JSON text, BLOB) for a cache value; (label, bytes) pairs keep their bytes in the BLOB."""
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], (bytes, bytearray, memoryview)):
+        return json.dumps(value[0]), bytes(value[1])
+    return json.dumps(value, ensure_ascii=False), None
+
+
+def decode_value(text: str, body: bytes | None) -> object:
+    value = json.loads(text)
+    return value if body is None else (value, bytes(body))
+
+
+class SqliteResponseCache:
+    """
+    Same interface as ResponseCache, shared across processes.
+
+    Keys are namespaced and prefixed with the table fingerprint, so entries
+    from older tables are never served and simply age out. Recency is
+    refreshed at most every `touch_seconds` per entry, which keeps reads
+    from turning into writes. Size limits are enforced every
+    `evict_every` writes, so they may overshoot briefly. Hit/miss counters
+    are per worker.
+    """
+
+    # Calls do file I/O and may wait on other workers' writes (up to the
+    # 5 s busy timeout): async code must run them in a thread.
+    blocking = True
+
+    def __init__(
+        self,
+        path: str | None = None,
+        namespace: str = "responses",
+        max_entries: int = 10_000,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float = 3600.0,
+        fingerprint: Callable[[], str] | None = None,
+        fingerprint_check_seconds: float = 30.0,
+        touch_seconds: float = 5.0,
+        evict_every: int = 64,
+    ):
+        self.path = path or default_path()
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._fingerprint_fn = fingerprint or (lambda: "")
+        self._fingerprint_check = fingerprint_check_seconds
+        self._touch_seconds = touch_seconds
+        self._evict_every = evict_every
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.fingerprint: str | None = None
+        self._next_check = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if os.path.exists(self.path):
+                _check_owner(self.path, os.stat(self.path))
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _key(self, key: Hashable) -> str:
+        if self.fingerprint is None:
+            self.refresh_fingerprint()
+        return json.dumps([self.fingerprint, key], ensure_ascii=False, default=str)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.max_bytes > 0
+
+    def refresh_fingerprint(self) -> bool:
+        fp = self._fingerprint_fn()
+        self._next_check = time.monotonic() + self._fingerprint_check
+        if fp == self.fingerprint:
+            return False
+        if self.fingerprint is not None:
+            self.invalidations += 1
+        self.fingerprint = fp
+        return True
+
+    def get(self, key: Hashable):
+        if time.monotonic() >= self._next_check:
+            self.refresh_fingerprint()
+
+        k = self._key(key)
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value, body, expires_at, accessed_at FROM entries_v2 WHERE ns = ? AND key = ?",
+            (self.namespace, k),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        text, body, expires_at, accessed_at = row
+        now = time.time()
+        if now >= expires_at:
+            conn.execute("DELETE FROM entries_v2 WHERE ns = ? AND key = ?", (self.namespace, k))
+            self.expirations += 1
+            self.misses += 1
+            return None
+        if now - accessed_at >= self._touch_seconds:
+            conn.execute(
+                "UPDATE entries_v2 SET accessed_at = ? WHERE ns = ? AND key = ?",
+                (now, self.namespace, k),
+            )
+        self.hits += 1
+        return decode_value(text, body)
+
+    def put(self, key: Hashable, value: object) -> None:
+        if not self.enabled:
+            return
+        text, body = encode_value(value)
+        size = len(text) + (len(body) if body is not None else 0)
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO entries_v2 (ns, key, value, body, size, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.namespace, self._key(key), text, body, size, now + self.ttl_seconds, now),
+        )
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self._evict_every == 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then least-recently-used ones past the limits."""
+        conn = self._conn()
+        ns = self.namespace
+        removed = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed += conn.execute(
+                "DELETE FROM entries_v2 WHERE ns = ? AND expires_at <= ?", (ns, time.time())
+            ).rowcount
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries_v2 WHERE ns = ?", (ns,)
+            ).fetchone()
+            if count > self.max_entries or total > self.max_bytes:
+                over_bytes = total - self.max_bytes
+                doomed = []
+                for k, size in conn.execute(
+                    "SELECT key, size FROM entries_v2 WHERE ns = ? ORDER BY accessed_at", (ns,)
+                ):
+                    if count <= self.max_entries and over_bytes <= 0:
+                        break
+                    doomed.append((ns, k))
+                    count -= 1
+                    over_bytes -= size
+                conn.executemany("DELETE FROM entries_v2 WHERE ns = ? AND key = ?", doomed)
+                self.evictions += len(doomed)
+                removed += len(doomed)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return removed
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        if not self.enabled:
+            return compute()
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM entries_v2 WHERE ns = ?", (self.namespace,))
+
+    def stats(self) -> Dict[str, object]:
+        count, total = self._conn().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries_v2 WHERE ns = ?", (self.namespace,)
+        ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "backend": "sqlite",
+            "path": self.path,
+            "entries": count,
+            "bytes": total,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "fingerprint": self.fingerprint,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
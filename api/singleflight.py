@@ -0,0 +1,118 @@
+# api/singleflight.py
+#
+# Request coalescing: at most one computation per key is in flight, and
+# every concurrent caller for that key shares its result (or its error).
+# Nothing is remembered once the flight lands; that is the cache's job.
+#
+#   SingleFlight       for sync code running in threads
+#   AsyncSingleFlight  for coroutines on one event loop
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import Awaitable, Callable, Dict, Hashable
+
+# INI_SINGLEFLIGHT=0 turns coalescing off (every caller computes).
+SINGLEFLIGHT_ENABLED = os.getenv("INI_SINGLEFLIGHT", "1") == "1"
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    do(key, fn): the first caller for `key` runs fn(); callers arriving
+    while it runs block until it finishes and get the same value, or the
+    same exception re-raised.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], object]):
+        if not self.enabled:
+            return fn()
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+            return call.value
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, object]:
+        return {"in_flight": len(self._calls), "leaders": self.leaders, "shared": self.shared}
+
+
+class AsyncSingleFlight:
+    """
+    Async form of SingleFlight. The computation runs as its own task and
+    callers await it through asyncio.shield(), so a cancelled caller
+    (client disconnect, timeout) only stops waiting: the flight still
+    finishes for everyone else. Engine work in a pool thread cannot be
+    interrupted anyway, and its result still fills the cache.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[object]]):
+        if not self.enabled:
+            return await fn()
+
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda t, k=key: self._land(k, t))
+            self.leaders += 1
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
+
+    def _land(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved; callers re-raise it themselves
+
+    def stats(self) -> Dict[str, object]:
+        return {"in_flight": len(self._tasks), "leaders": self.leaders, "shared": self.shared}
+
+
+# Engine computations keyed by (engine name, topic key).
+ENGINE_FLIGHTS = SingleFlight(SINGLEFLIGHT_ENABLED)
+ASYNC_ENGINE_FLIGHTS = AsyncSingleFlight(SINGLEFLIGHT_ENABLED)
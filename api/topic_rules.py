@@ -0,0 +1,418 @@
+# api/topic_rules.py
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Callable, Dict, List, Mapping, NamedTuple, Sequence, Tuple
+
+from api.topic_types import TOPIC_TYPES
+
+
+# -----------------------------
+# Rule tables
+# (Edit these; the matcher below is compiled once at import.)
+# -----------------------------
+TOPIC_PREFIXES: List[str] = [
+    "explain to me",
+    "explain",
+    "tell me about",
+    "can you teach me about",
+    "teach me about",
+    "help me understand",
+    "what is",
+    "what are",
+    "how to",
+    "how do i",
+]
+
+# Type detection rules come from the topic-type registry (api/topic_types.py),
+# in priority order: the first type with a matching keyword wins.
+TOPIC_TYPE_RULES: List[Tuple[str, float, List[str]]] = TOPIC_TYPES.type_rules
+
+DEFAULT_TOPIC_TYPE: Tuple[str, float] = TOPIC_TYPES.default_rule
+
+# Expanded before prefix stripping, so "what's X" loses its "what is".
+CONTRACTIONS: Dict[str, str] = {
+    "what's": "what is",
+    "whats": "what is",
+    "what're": "what are",
+    "how's": "how is",
+    "how'd": "how did",
+    "who's": "who is",
+    "where's": "where is",
+    "why's": "why is",
+    "it's": "it is",
+    "let's": "let us",
+    "i'm": "i am",
+    "i've": "i have",
+    "i'd": "i would",
+    "can't": "cannot",
+    "don't": "do not",
+    "doesn't": "does not",
+    "isn't": "is not",
+    "aren't": "are not",
+    "won't": "will not",
+}
+
+# Alias -> canonical topic. TOPIC_ALIASES match only the whole topic (after
+# prefix stripping), so short ones like "ml" never rewrite "how many ml in a
+# cup". TOPIC_PHRASE_ALIASES match on whole words anywhere in the topic
+# (longest first); keep them to unambiguous phrases.
+TOPIC_ALIASES: Dict[str, str] = {
+    "ai": "artificial intelligence",
+    "a.i": "artificial intelligence",
+    "ml": "machine learning",
+    "llm": "large language model",
+    "llms": "large language models",
+    "k8s": "kubernetes",
+    "js": "javascript",
+}
+
+TOPIC_PHRASE_ALIASES: Dict[str, str] = {}
+
+
+def load_topic_aliases(path: str | None = None) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    (exact, phrase) alias tables: the defaults above plus the JSON object at
+    `path` (default: INI_TOPIC_ALIASES). Each entry there is either
+    "alias": "canonical" (whole topic) or
+    "alias": {"canonical": "...", "match": "exact" | "contains"}.
+    """
+    exact, phrase = dict(TOPIC_ALIASES), dict(TOPIC_PHRASE_ALIASES)
+    path = path or os.getenv("INI_TOPIC_ALIASES")
+    if not path:
+        return exact, phrase
+    with open(path, encoding="utf-8") as f:
+        extra = json.load(f)
+    if not isinstance(extra, dict):
+        raise ValueError(f"{path}: expected a JSON object of aliases")
+    for alias, entry in extra.items():
+        if isinstance(entry, str):
+            exact[alias] = entry
+        elif (
+            isinstance(entry, dict)
+            and isinstance(entry.get("canonical"), str)
+            and entry.get("match", "exact") in ("exact", "contains")
+        ):
+            table = phrase if entry.get("match") == "contains" else exact
+            table[alias] = entry["canonical"]
+        else:
+            raise ValueError(
+                f"{path}: alias {alias!r}: expected a string or "
+                '{"canonical": ..., "match": "exact" | "contains"}'
+            )
+    return exact, phrase
+
+
+class TopicAnalysis(NamedTuple):
+    topic: str  # canonical topic, in display case
+    topic_type: str  # detected on `key`, so one key always has one type
+    confidence: float
+    key: str  # canonical topic, lowercase: the cache / index key
+
+
+# -----------------------------
+# Type keyword matching
+# -----------------------------
+DETECT_CACHE_SIZE = 4096
+CANONICAL_CACHE_SIZE = 4096
+
+
+def _keyword_search(keywords: Sequence[str]):
+    """search() of one alternation over a type's keywords (longest first), so the scan runs in C."""
+    words = sorted({kw for kw in keywords if kw}, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, words))).search if words else None
+
+
+# -----------------------------
+# Canonicalization helpers
+# -----------------------------
+# Folded to a space (or dropped) before splitting into words. Characters
+# that can be part of a name (+ # . / - & ') are kept: "c++", "node.js".
+_FOLD_TO_SPACE = "!?,;:\"()[]{}<>|\\*~`^\u00a1\u00bf\u00ab\u00bb\u201c\u201d\u201e\u2013\u2014"
+_FOLD_TO_QUOTE = "\u2018\u2019\u02bc"
+_FOLD_DROP = "\u200b\u200c\u200d\u2060\ufeff\u00ad"
+
+_ASCII_FOLD_CHARS = "".join(ch for ch in _FOLD_TO_SPACE if ch.isascii()).encode("ascii")
+_ASCII_FOLD = bytes.maketrans(  # lowercase + fold in one C-level pass
+    _ASCII_FOLD_CHARS + b"ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    b" " * len(_ASCII_FOLD_CHARS) + b"abcdefghijklmnopqrstuvwxyz",
+)
+_SPACE_RE = re.compile("[" + re.escape(_FOLD_TO_SPACE) + "]")
+_RARE_RE = re.compile("[" + re.escape(_FOLD_TO_QUOTE + _FOLD_DROP) + "]")
+_FOLD = str.maketrans(
+    {
+        **{ch: " " for ch in _FOLD_TO_SPACE},
+        **{ch: "'" for ch in _FOLD_TO_QUOTE},
+        **{ch: None for ch in _FOLD_DROP},
+    }
+)
+
+
+def _fold(text: str) -> Tuple[str, List[str]]:
+    """NFKC + casefold + punctuation/whitespace folding: (folded text, words)."""
+    if text.isascii():  # fast path: NFKC and casefold are no-ops beyond lower()
+        t = text.encode("ascii").translate(_ASCII_FOLD).decode("ascii")
+    else:
+        t = unicodedata.normalize("NFKC", text).casefold()
+        # str.translate is slow on non-ASCII text: only use it when a curly
+        # quote or invisible character needs mapping.
+        t = t.translate(_FOLD) if _RARE_RE.search(t) else _SPACE_RE.sub(" ", t)
+    words = t.split()
+    if "'" in t or "-" in t or "." in t:
+        words = [w for w in (w.strip("'-").rstrip(".") for w in words) if w]
+    return t, words
+
+
+def _fold_words(text: str) -> List[str]:
+    return _fold(text)[1]
+
+
+# The display keeps the user's own characters: punctuation is folded the
+# same way (fullwidth forms included, which NFKC folds in keys) but case,
+# NFKC forms and contractions are left alone.
+_FULLWIDTH_TO_SPACE = "".join(
+    chr(cp) for cp in range(0xFF01, 0xFF5F) if unicodedata.normalize("NFKC", chr(cp)) in _FOLD_TO_SPACE
+)
+_ASCII_DISPLAY_FOLD = bytes.maketrans(_ASCII_FOLD_CHARS, b" " * len(_ASCII_FOLD_CHARS))
+_DISPLAY_SPACE_RE = re.compile("[" + re.escape(_FOLD_TO_SPACE + _FULLWIDTH_TO_SPACE) + "]")
+
+
+def _display(text: str, skip: int, lead: List[str]) -> str:
+    """
+    The user's words after the first `skip` folded words (see _fold),
+    punctuation folded and capitalized, after the `lead` words.
+    """
+    if text.isascii():
+        t = text.encode("ascii").translate(_ASCII_DISPLAY_FOLD).decode("ascii")
+    else:
+        t = _DISPLAY_SPACE_RE.sub(" ", text)
+        if _RARE_RE.search(t):
+            t = t.translate(_FOLD)
+    words = t.split()
+    if "'" in t or "-" in t or "." in t:
+        words = [w for w in (w.strip("'-").rstrip(".") for w in words) if w]
+    if skip:
+        if text.isascii():
+            words = words[skip:]  # folding only lowercases here: words line up one to one
+        else:
+            # NFKC can split or join words: count each word's folded words.
+            # A word only partly skipped is kept whole.
+            i = 0
+            while i < len(words):
+                n = len(_fold(words[i])[1])
+                if n > skip:
+                    break
+                skip -= n
+                i += 1
+            words = words[i:]
+    return _capitalize(lead + words if lead else words)
+
+
+def _capitalize(words: List[str]) -> str:
+    text = " ".join(words)
+    if text.isascii() and text.replace(" ", "").isalpha():
+        return text.title()  # same as capitalizing each word here, and faster
+    return " ".join([w.capitalize() for w in words])
+
+
+# -----------------------------
+# Compiled topic rules
+# -----------------------------
+class TopicRules:
+    """
+    Topic canonicalization + topic-type detection, compiled from rule tables.
+    """
+
+    def __init__(
+        self,
+        prefixes: Sequence[str],
+        type_rules: Sequence[Tuple[str, float, Sequence[str]]],
+        default: Tuple[str, float] = DEFAULT_TOPIC_TYPE,
+        contractions: Mapping[str, str] = CONTRACTIONS,
+        aliases: Mapping[str, str] | None = None,
+        phrase_aliases: Mapping[str, str] | None = None,
+        detect_cache_size: int = DETECT_CACHE_SIZE,
+        canonical_cache_size: int = CANONICAL_CACHE_SIZE,
+    ):
+        self.canonical_tables = [
+            list(prefixes), dict(contractions), dict(aliases or {}), dict(phrase_aliases or {}),
+        ]
+
+        # Every table is folded like topics, so entries match however they
+        # were typed, and matching is by whole words.
+        # Prefixes: first word -> [prefix words] in list order (earlier wins).
+        self._prefixes: Dict[str, List[List[str]]] = {}
+        for p in prefixes:
+            words = _fold_words(p)
+            if words:
+                self._prefixes.setdefault(words[0], []).append(words)
+
+        self._contractions: Dict[str, List[str]] = {}
+        for word, expansion in contractions.items():
+            folded = _fold_words(word)
+            if len(folded) == 1:
+                self._contractions[folded[0]] = _fold_words(expansion)
+
+        self._exact: Dict[str, str] = {}
+        for alias, canonical in (aliases or {}).items():
+            words = _fold_words(alias)
+            if words:
+                self._exact[" ".join(words)] = " ".join(_fold_words(canonical))
+
+        self._alias_display = {
+            c: " ".join([w.capitalize() for w in c.split()]) for c in self._exact.values()
+        }
+
+        self._phrases: Dict[Tuple[str, ...], List[str]] = {}
+        for alias, canonical in (phrase_aliases or {}).items():
+            words = tuple(_fold_words(alias))
+            if words:
+                self._phrases[words] = _fold_words(canonical)
+        self._phrase_first = {k[0] for k in self._phrases}
+        self._phrase_max = max((len(k) for k in self._phrases), default=0)
+
+        # Substring match per type, in priority order (earlier types win).
+        self._matchers: List[Tuple[Callable, Tuple[str, float]]] = []
+        for name, conf, kws in type_rules:
+            search = _keyword_search(kws)
+            if search is not None:
+                self._matchers.append((search, (name, conf)))
+        self._default = default
+        self.detect = lru_cache(maxsize=detect_cache_size)(self._detect) if detect_cache_size else self._detect
+        self.canonical = (
+            lru_cache(maxsize=canonical_cache_size)(self._canonical) if canonical_cache_size else self._canonical
+        )
+
+    def _apply_phrases(self, words: List[str]) -> List[str]:
+        phrases, longest = self._phrases, self._phrase_max
+        out: List[str] = []
+        i, n = 0, len(words)
+        while i < n:
+            for size in range(min(longest, n - i), 0, -1):
+                canonical = phrases.get(tuple(words[i:i + size]))
+                if canonical is not None:
+                    out.extend(canonical)
+                    i += size
+                    break
+            else:
+                out.append(words[i])
+                i += 1
+        return out
+
+    def _resolve(self, text: str) -> Tuple[str, int | None, List[str]]:
+        """
+        (key, skip, lead). The key is the topic Unicode-normalized, casefolded,
+        punctuation and whitespace folded, contractions expanded, leading
+        question prefixes stripped and aliases resolved. `skip` is how many
+        of the folded words (before contraction expansion) the prefixes
+        consumed, or None when an alias rewrote the topic. When a prefix
+        ends inside a contraction ("what|isn't"), that word counts as
+        consumed and `lead` holds the rest of its expansion (["not"]).
+        Each step is skipped when no word can match its table.
+        """
+        source = _fold(text)[1]
+        if not source:
+            return "", 0, []
+
+        # Contractions are expanded while matching prefixes ("what's",
+        # "whats"); after them, only words written with an apostrophe are
+        # ("i'm" but not "whats"), so the rule does not depend on position.
+        contractions = self._contractions
+        if contractions.keys().isdisjoint(source):
+            words, src = source, None
+        else:
+            words, src = [], []  # src: index of the source word behind each word
+            for i, w in enumerate(source):
+                x = contractions.get(w)
+                if x is None:
+                    words.append(w)
+                    src.append(i)
+                else:
+                    words.extend(x)
+                    src.extend([i] * len(x))
+
+        prefixes = self._prefixes
+        consumed = 0
+        while consumed < len(words):
+            candidates = prefixes.get(words[consumed])
+            if candidates is None:
+                break
+            for p in candidates:
+                if words[consumed:consumed + len(p)] == p:
+                    consumed += len(p)
+                    break
+            else:
+                break
+
+        lead: List[str] = []
+        if src is None:
+            skip = consumed
+            rest = words[consumed:] if consumed else words
+        elif consumed == len(words):
+            skip, rest = len(source), []
+        else:
+            skip = src[consumed]
+            if consumed and src[consumed - 1] == skip:  # a prefix ended inside this word's expansion
+                lead = words[consumed:consumed + src[consumed:].count(skip)]
+                skip += 1
+            rest = list(lead)
+            for w in source[skip:]:
+                x = contractions.get(w) if "'" in w else None
+                if x is None:
+                    rest.append(w)
+                else:
+                    rest.extend(x)
+
+        key = " ".join(rest)
+        canonical = self._exact.get(key)
+        if canonical is not None:
+            return canonical, None, lead
+        if self._phrases and not self._phrase_first.isdisjoint(rest):
+            canonical = " ".join(self._apply_phrases(rest))
+            if canonical != key:
+                return canonical, None, lead
+        return key, skip, lead
+
+    def key(self, text: str) -> str:
+        """Canonical topic, lowercase ("what's AI?" -> "artificial intelligence")."""
+        return self.canonical(text)[1]
+
+    def _canonical(self, text: str) -> Tuple[str, str]:
+        """
+        (display topic, key); memoized per text as canonical(). The display
+        is the user's own words after the prefixes, capitalized; an aliased
+        topic displays its canonical form.
+        """
+        key, skip, lead = self._resolve(text)
+        if skip is None:
+            display = self._alias_display.get(key)
+            return (display if display is not None else _capitalize(key.split())), key
+        return _display(text, skip, lead), key
+
+    def clean(self, text: str) -> str:
+        """Topic in display case ("what's AI?" -> "Artificial Intelligence", "i'm stuck" -> "I'm Stuck")."""
+        return self.canonical(text)[0]
+
+    def _detect(self, topic: str) -> Tuple[str, float]:
+        """(type, confidence); memoized per topic as detect()."""
+        t = topic.casefold()
+        for search, rule in self._matchers:
+            if search(t) is not None:
+                return rule
+        return self._default
+
+    def analyze(self, text: str) -> TopicAnalysis:
+        clean, key = self.canonical(text)
+        topic_type, confidence = self.detect(key)
+        return TopicAnalysis(clean, topic_type, confidence, key)
+
+
+_EXACT_ALIASES, _PHRASE_ALIASES = load_topic_aliases()
+TOPIC_RULES = TopicRules(
+    TOPIC_PREFIXES, TOPIC_TYPE_RULES, aliases=_EXACT_ALIASES, phrase_aliases=_PHRASE_ALIASES,
+)
@@ -0,0 +1,238 @@
+# api/topic_types.py
+#
+# Topic-type registry. Each type is declared once: how it is detected
+# (keywords + confidence), its illustration slots (key, template, support
+# heading) and the question templates it uses. The declarations are
+# compiled at import into lookup tables: detection is one compiled keyword
+# regex per type, memoized per topic (api/topic_rules.py), and everything
+# else is a dict lookup.
+#
+# INI_TOPIC_TYPES may point at a JSON list of extra types, e.g.
+#   [{"name": "recipe", "confidence": 0.7, "keywords": ["recipe", "bake"],
+#     "illustrations": [["dish", "A dish that uses {t}.", "Examples"]]}]
+# "questions" is optional ({category: [[slot, template], ...]}). An entry
+# with an existing name replaces that type in place.
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+QuestionSet = Dict[str, List[Tuple[str, str]]]
+
+
+# -----------------------------
+# Question templates
+# Each question names the answer "slot" it wants, so answers are picked by
+# slot rather than by re-scanning the rendered question text.
+# -----------------------------
+QUESTION_TEMPLATES: QuestionSet = {
+    "What": [
+        ("plain", "What is {t} in plain language?"),
+        ("problem", "What problem does {t} exist to solve?"),
+        ("benefits", "What are the main benefits of {t}?"),
+        ("limitations", "What are the limitations of {t}?"),
+    ],
+    "Why": [
+        ("default", "Why does {t} matter?"),
+        ("confused", "Why do people get confused about {t}?"),
+    ],
+    "How": [
+        ("default", "How does {t} work at a high level?"),
+        ("check", "How can I tell if I truly understand {t}?"),
+    ],
+    "Where": [
+        ("default", "Where is {t} used in real life?"),
+        ("fail", "Where does {t} fail or break in practice?"),
+    ],
+    "Examples": [
+        ("simple_example", "What is a simple example of {t}?"),
+        ("default", "What are real-world examples of {t}?"),
+    ],
+    "Misconceptions": [
+        ("misconception", "What is a common misconception about {t}?"),
+    ],
+    "Common Challenges": [
+        ("default", "What challenges do people face when working with {t}?"),
+    ],
+    "Related Topics": [
+        ("default", "What topics are closely related to {t}?"),
+    ],
+}
+
+
+class TopicType(NamedTuple):
+    name: str
+    confidence: float
+    keywords: Tuple[str, ...]                        # detection; earlier types win
+    illustrations: Tuple[Tuple[str, str, str], ...]  # (key, template with {t}, support heading)
+    questions: QuestionSet | None = None             # None: QUESTION_TEMPLATES
+
+
+# -----------------------------
+# Declarations (priority order: the first type with a matching keyword wins)
+# -----------------------------
+TOPIC_TYPES_DECLARED: List[TopicType] = [
+    TopicType("comparison", 0.67, (" vs ", " versus ", "compare"), (
+        ("side_by_side", "A vs B comparison scenario for {t}.", "Differences"),
+        ("winner_case", "When option A clearly wins.", "Who Should Choose What"),
+        ("loser_case", "When option B is the wrong choice.", "Common Traps"),
+        ("tie_case", "When both options are equally acceptable.", "Decision Rule"),
+    )),
+    TopicType("decision", 0.67, ("should i", "better", "choose"), (
+        ("option_a", "Scenario where choosing one option in {t} makes sense.", "Options"),
+        ("option_b", "Scenario where the alternative is better.", "Options"),
+        ("tradeoff", "What you gain vs what you give up.", "Tradeoffs"),
+        ("regret_case", "A common regret people report after deciding poorly.", "Risks"),
+    )),
+    TopicType("troubleshooting", 0.75, ("error", "not working", "failed", "issue"), (
+        ("symptom", "A real-world symptom where {t} appears.", "Describe"),
+        ("root_cause", "A common underlying cause for this issue.", "Isolate"),
+        ("fix", "A safe first fix most people should try.", "Fix"),
+        ("prevention", "How to avoid this issue in the future.", "Fix"),
+    )),
+    TopicType("skill", 0.67, ("learn", "practice", "how to"), (
+        ("beginner", "A beginner practicing {t} for the first time.", "Basics"),
+        ("practice", "A concrete practice exercise.", "Practice"),
+        ("mistake", "A mistake beginners commonly make.", "Common Mistakes"),
+        ("progress", "What improvement looks like after consistent practice.", "Next Level"),
+    )),
+    # default: used when nothing matches (its keywords are ignored)
+    TopicType("concept", 0.67, (), (
+        ("everyday", "An everyday example of {t}.", "What"),
+        ("work", "A professional use of {t}.", "Where"),
+        ("analogy", "An analogy to explain {t} simply.", "How"),
+        ("failure", "What goes wrong without understanding {t}.", "Why"),
+    )),
+]
+
+DEFAULT_TYPE = "concept"
+
+
+def load_topic_types(path: str | None = None) -> List[TopicType]:
+    """TOPIC_TYPES_DECLARED plus the JSON list at `path` (default: INI_TOPIC_TYPES)."""
+    types = list(TOPIC_TYPES_DECLARED)
+    path = path or os.getenv("INI_TOPIC_TYPES")
+    if not path:
+        return types
+    with open(path, encoding="utf-8") as f:
+        extra = json.load(f)
+    if not isinstance(extra, list):
+        raise ValueError(f"{path}: expected a JSON list of topic types")
+    for entry in extra:
+        try:
+            questions = entry.get("questions")
+            types.append(TopicType(
+                name=entry["name"],
+                confidence=float(entry["confidence"]),
+                keywords=tuple(entry.get("keywords", ())),
+                illustrations=tuple((k, tpl, sup) for k, tpl, sup in entry["illustrations"]),
+                questions=None if questions is None else {
+                    cat: [(slot, tpl) for slot, tpl in templates] for cat, templates in questions.items()
+                },
+            ))
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"{path}: bad topic type {entry!r}: {e}") from None
+    return types
+
+
+# -----------------------------
+# Compiled registry
+# -----------------------------
+_TOPIC_SLOT = "\x00topic\x00"  # as in api/interrogate.py plans
+
+
+def _template_parts(tpl: str) -> Tuple[str, ...]:
+    """The text around each {t} in `tpl`, with its {{ }} escapes already applied."""
+    return tuple(tpl.format(t=_TOPIC_SLOT).split(_TOPIC_SLOT))
+
+
+class TopicTypeRegistry:
+    """
+    Lookup tables compiled from TopicType declarations. Question sets are
+    shared by content, so plans (api/interrogate.py) are compiled once per
+    distinct set rather than once per type.
+    """
+
+    def __init__(self, types: Sequence[TopicType], default: str = DEFAULT_TYPE):
+        by_name: Dict[str, TopicType] = {}
+        for tt in types:
+            by_name[tt.name] = tt  # a redeclared name keeps its original position
+        if default not in by_name:
+            raise ValueError(f"Default topic type {default!r} is not declared")
+
+        self.types: Tuple[TopicType, ...] = tuple(by_name.values())
+        self.default = default
+
+        # Detection rules in priority order, for TopicRules. Keywords are
+        # casefolded like the text they are matched against.
+        self.type_rules: List[Tuple[str, float, List[str]]] = [
+            (tt.name, tt.confidence, [kw.casefold() for kw in tt.keywords])
+            for tt in self.types
+            if tt.name != default and tt.keywords
+        ]
+        self.default_rule: Tuple[str, float] = (default, by_name[default].confidence)
+
+        self._illustrations: Dict[str, Tuple[Tuple[str, str], ...]] = {
+            tt.name: tuple((key, tpl) for key, tpl, _ in tt.illustrations) for tt in self.types
+        }
+        # Each template split around its topic slot: topic.join(parts) fills
+        # it like tpl.format(t=topic), without re-parsing the template.
+        self._illustration_parts: Dict[str, Tuple[Tuple[str, Tuple[str, ...]], ...]] = {
+            name: tuple((key, _template_parts(tpl)) for key, tpl in templates)
+            for name, templates in self._illustrations.items()
+        }
+        self._supports: Dict[str, Dict[str, str]] = {
+            tt.name: {key: heading for key, _, heading in tt.illustrations} for tt in self.types
+        }
+
+        self.question_sets: List[QuestionSet] = []
+        self._question_set: Dict[str, int] = {}
+        seen: Dict[str, int] = {}
+        for tt in self.types:
+            questions = tt.questions or QUESTION_TEMPLATES
+            sig = json.dumps(questions)
+            idx = seen.get(sig)
+            if idx is None:
+                idx = seen[sig] = len(self.question_sets)
+                self.question_sets.append(questions)
+            self._question_set[tt.name] = idx
+        # Question templates pre-split like the illustrations, per set.
+        self._question_parts: List[Dict[str, Tuple[Tuple[str, ...], ...]]] = [
+            {cat: tuple(_template_parts(tpl) for _, tpl in templates) for cat, templates in qs.items()}
+            for qs in self.question_sets
+        ]
+
+        # Every category any type can produce, in first-declared order.
+        self.categories: Tuple[str, ...] = tuple(
+            dict.fromkeys(cat for qs in self.question_sets for cat in qs)
+        )
+
+    def illustration_templates(self, topic_type: str) -> Tuple[Tuple[str, str], ...]:
+        """(key, template) pairs in display order; unknown types use the default."""
+        found = self._illustrations.get(topic_type)
+        return self._illustrations[self.default] if found is None else found
+
+    def illustration_parts(self, topic_type: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """illustration_templates(), each template pre-split for topic.join(parts)."""
+        found = self._illustration_parts.get(topic_type)
+        return self._illustration_parts[self.default] if found is None else found
+
+    def support_map(self, topic_type: str) -> Dict[str, str]:
+        found = self._supports.get(topic_type)
+        return dict(self._supports[self.default] if found is None else found)
+
+    def question_set_id(self, topic_type: str) -> int:
+        found = self._question_set.get(topic_type)
+        return self._question_set[self.default] if found is None else found
+
+    def questions(self, topic_type: str) -> QuestionSet:
+        return self.question_sets[self.question_set_id(topic_type)]
+
+    def question_parts(self, topic_type: str) -> Dict[str, Tuple[Tuple[str, ...], ...]]:
+        """questions() as category -> pre-split templates, for topic.join(parts)."""
+        return self._question_parts[self.question_set_id(topic_type)]
+
+
+TOPIC_TYPES = TopicTypeRegistry(load_topic_types())
@@ -0,0 +1,66 @@
+# bench/engine_pool.py
+#
+# Throughput of uncached interrogate() jobs through EnginePool as the
+# worker count grows (the scaling curve for one uvicorn process).
+#
+#   python -m bench.engine_pool [--mode process|thread] [--jobs 4000]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import time
+
+from api.executor import EnginePool, Overloaded
+from api.interrogate import analyze_topic, interrogate_analysis
+
+
+def _worker_counts(max_workers: int):
+    n = 1
+    while n < max_workers:
+        yield n
+        n *= 2
+    yield max_workers
+
+
+async def _run(pool: EnginePool, jobs: int) -> float:
+    analyses = [analyze_topic(f"topic number {i} explained") for i in range(jobs)]
+    start = time.perf_counter()
+    await asyncio.gather(*(pool.run(interrogate_analysis, a) for a in analyses))
+    return jobs / (time.perf_counter() - start)
+
+
+async def _overload_check() -> None:
+    pool = EnginePool("thread", workers=1, queue_limit=2)
+    results = await asyncio.gather(
+        *(pool.run(time.sleep, 0.05) for _ in range(10)),
+        return_exceptions=True,
+    )
+    rejected = sum(isinstance(r, Overloaded) for r in results)
+    pool.shutdown()
+    print(f"overload check: 10 jobs, 1 worker + queue 2 -> {rejected} rejected fast")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", default="process", choices=["process", "thread"])
+    parser.add_argument("--jobs", type=int, default=4000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'ops/sec':>10} {'scale':>6}")
+    base = None
+    for workers in _worker_counts(args.max_workers):
+        pool = EnginePool(args.mode, workers=workers, queue_limit=args.jobs)
+        asyncio.run(_run(pool, workers * 4))  # warm the workers
+        ops = asyncio.run(_run(pool, args.jobs))
+        pool.shutdown()
+        base = base or ops
+        print(f"{workers:>8} {ops:>10.0f} {ops / base:>5.2f}x")
+
+    asyncio.run(_overload_check())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# bench/import_time.py
+#
+# Cold-start regression check: `import api.main` in fresh interpreters must
+# stay under a time budget and must not load any engine module (those load
+# lazily, see api/engines.py). Exits non-zero on failure, so it can gate CI.
+#
+#   python -m bench.import_time
+#   python -m bench.import_time --budget-ms 600 --runs 7
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List
+
+# Modules that must stay unloaded until first use / warm-up.
+LAZY_MODULES = ("api.interrogate", "api.illustrate", "api.knowledge", "api.topic_rules",
+                "api.topic_types", "api.compact")
+
+_PROBE = """
+import sys, time
+t = time.perf_counter()
+import api.main
+ms = (time.perf_counter() - t) * 1000.0
+eager = [m for m in {lazy!r} if m in sys.modules]
+print(ms, ",".join(eager))
+"""
+
+
+def measure(runs: int) -> tuple:
+    """(import times in ms, engine modules loaded eagerly) over `runs` fresh interpreters."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root, INI_WARMUP="off")
+    times: List[float] = []
+    eager: set = set()
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(lazy=LAZY_MODULES)],
+            cwd=root, env=env, capture_output=True, text=True, check=True,
+        ).stdout.strip().splitlines()[-1]
+        ms, _, loaded = out.partition(" ")
+        times.append(float(ms))
+        eager.update(m for m in loaded.split(",") if m)
+    return times, sorted(eager)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bench.import_time")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("INI_IMPORT_BUDGET_MS", "1000")))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    times, eager = measure(args.runs)
+    median = statistics.median(times)
+    print(f"import api.main: median {median:.1f} ms over {args.runs} runs "
+          f"(min {min(times):.1f}, max {max(times):.1f}; budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if median > args.budget_ms:
+        print(f"FAIL: over budget by {median - args.budget_ms:.1f} ms")
+        failed = True
+    if eager:
+        print(f"FAIL: engine modules loaded at import: {', '.join(eager)}")
+        failed = True
+    if not failed:
+        print("ok")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+# bench/interrogate_plans.py
+#
+# Micro-benchmark: precompiled plans vs per-request formatting + answer
+# dispatch (build_categories + attach_answers).
+#
+#   python -m bench.interrogate_plans
+
+from __future__ import annotations
+
+import timeit
+
+from api.interrogate import (
+    analyze_topic,
+    attach_answers,
+    build_categories,
+    get_plan,
+    render_plan,
+)
+
+
+SAMPLES = [
+    "What is artificial intelligence?",
+    "Explain to me Python vs Rust for CLI tools",
+    "docker permission error on mac",
+    "help me understand photosynthesis",
+]
+
+
+def _per_op_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    number = 2000
+    analyses = [analyze_topic(s) for s in SAMPLES]
+
+    print(f"{'topic':<40} {'dispatch us':>12} {'plan us':>10} {'speedup':>8}")
+    for a in analyses:
+        def dispatch():
+            attach_answers(build_categories(a.topic, a.topic_type), a.topic, a.topic_type)
+
+        def planned():
+            render_plan(get_plan(a.topic, a.topic_type), a.topic)
+
+        assert (
+            attach_answers(build_categories(a.topic, a.topic_type), a.topic, a.topic_type)
+            == render_plan(get_plan(a.topic, a.topic_type), a.topic)
+        ), a.topic
+        d = _per_op_us(dispatch, number)
+        p = _per_op_us(planned, number)
+        print(f"{a.topic[:40]:<40} {d:>12.2f} {p:>10.2f} {d / p:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# bench/suite.py
+#
+# Micro-benchmark suite for the core engines, with JSON baselines.
+#
+#   python -m bench.suite run                          # print results
+#   python -m bench.suite run --save bench/baselines/local.json
+#   python -m bench.suite compare bench/baselines/local.json --threshold 0.15
+#
+# `compare` exits non-zero when any case's ops/sec falls more than
+# --threshold (fraction) below the baseline. Baselines are machine-specific:
+# record one on the host that runs the comparison.
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, NamedTuple
+
+from api.illustrate import illustrate
+from api.interrogate import (
+    analyze_topic,
+    attach_answers,
+    build_categories,
+    detect_topic_type,
+    extract_topic,
+    interrogate,
+    interrogate_analysis,
+)
+from api.masks import make_mask
+from api.resume import resume
+
+
+class Case(NamedTuple):
+    name: str
+    fn: Callable[[], object]
+
+
+# -----------------------------
+# Inputs
+# -----------------------------
+REALISTIC = {
+    "concept": "What is photosynthesis?",
+    "ai_core": "Explain to me artificial intelligence",
+    "ai_short": "ai",
+    "comparison": "Python vs Rust for command line tools",
+    "decision": "Should I choose Postgres or MySQL?",
+    "troubleshooting": "docker build not working after upgrade",
+    "skill": "How do I learn to practice piano daily",
+}
+
+ADVERSARIAL = {
+    "long_topic": "tell me about " + " ".join(f"word{i}" for i in range(2000)) + "?!?",
+    "long_no_match": "x" * 10_000,
+    "prefix_only": "explain to me",
+    "whitespace": "   \t  what   is   \n  machine     learning  ???  ",
+    "unicode": "Qu'est-ce que l'intelligence artificielle — 人工知能 ? 🤖",
+    "late_keyword": "a " * 3000 + "vs b",
+}
+
+
+def build_cases() -> List[Case]:
+    cases: List[Case] = []
+    inputs = {**{f"real/{k}": v for k, v in REALISTIC.items()},
+              **{f"adv/{k}": v for k, v in ADVERSARIAL.items()}}
+
+    for label, text in inputs.items():
+        a = analyze_topic(text)
+        cats = build_categories(a.topic, a.topic_type)
+        cases.extend([
+            Case(f"extract_topic[{label}]", lambda text=text: extract_topic(text)),
+            Case(f"detect_topic_type[{label}]", lambda t=a.topic: detect_topic_type(t)),
+            Case(f"build_categories[{label}]", lambda a=a: build_categories(a.topic, a.topic_type)),
+            Case(f"attach_answers[{label}]", lambda a=a, c=cats: attach_answers(c, a.topic, a.topic_type)),
+            Case(f"interrogate[{label}]", lambda text=text: interrogate(text)),
+            Case(f"illustrate[{label}]", lambda text=text: illustrate(text)),
+        ])
+
+    # Field-masked generation: only ORIENT questions, no summary.
+    orient = make_mask(archetypes=["ORIENT"], summary=False)
+    for label in ("real/concept", "real/ai_core"):
+        a = analyze_topic(inputs[label])
+        cases.append(Case(f"interrogate_orient_only[{label}]", lambda a=a: interrogate_analysis(a, mask=orient)))
+
+    cases.append(Case("resume", resume))
+    return cases
+
+
+# -----------------------------
+# Measurement
+# -----------------------------
+def measure(fn: Callable[[], object], min_time: float = 0.1, repeat: int = 5) -> float:
+    """Best-of-`repeat` ops/sec, each repeat running for at least `min_time`."""
+    timer = timeit.Timer(fn)
+    number, elapsed = timer.autorange()
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return number / best
+
+
+def run(cases: List[Case], min_time: float) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for case in cases:
+        results[case.name] = measure(case.fn, min_time=min_time)
+        print(f"{case.name:<60} {results[case.name]:>14,.0f} ops/s", flush=True)
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    failures = []
+    print(f"\n{'case':<60} {'baseline':>12} {'now':>12} {'change':>8}")
+    for name, now in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<60} {'-':>12} {now:>12,.0f} {'new':>8}")
+            continue
+        change = now / base - 1
+        flag = ""
+        if change < -threshold:
+            failures.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<60} {base:>12,.0f} {now:>12,.0f} {change:>+7.1%}{flag}")
+    return failures
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m bench.suite")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_run = sub.add_parser("run")
+    p_run.add_argument("--save", help="write results to this baseline JSON file")
+
+    p_cmp = sub.add_parser("compare")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("--threshold", type=float, default=0.15,
+                       help="allowed ops/sec drop as a fraction (default 0.15)")
+
+    for p in (p_run, p_cmp):
+        p.add_argument("-k", "--filter", default="", help="only cases whose name contains this")
+        p.add_argument("--min-time", type=float, default=0.1, help="seconds per timing repeat")
+
+    args = parser.parse_args(argv)
+    cases = [c for c in build_cases() if args.filter in c.name]
+    results = run(cases, args.min_time)
+
+    if args.cmd == "run":
+        if args.save:
+            with open(args.save, "w", encoding="utf-8") as f:
+                json.dump({
+                    "meta": {
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    },
+                    "ops_per_sec": results,
+                }, f, indent=2, sort_keys=True)
+                f.write("\n")
+            print(f"\nsaved baseline to {args.save}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["ops_per_sec"]
+    failures = compare(results, baseline, args.threshold)
+    if failures:
+        print(f"\n{len(failures)} case(s) regressed more than {args.threshold:.0%}")
+        return 1
+    print("\nno regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
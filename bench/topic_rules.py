@@ -0,0 +1,136 @@
+# bench/topic_rules.py
+#
+# Micro-benchmark: compiled TopicRules vs the original list-scanning
+# extract_topic / detect_topic_type.
+#
+#   python -m bench.topic_rules
+
+from __future__ import annotations
+
+import random
+import string
+import timeit
+from typing import List, Tuple
+
+from api.topic_rules import TOPIC_PREFIXES, TOPIC_TYPE_RULES, TopicRules
+
+
+# -----------------------------
+# Original implementations (reference)
+# -----------------------------
+def legacy_extract_topic(text: str) -> str:
+    t = text.strip().lower()
+    prefixes = [
+        "explain to me",
+        "explain",
+        "tell me about",
+        "can you teach me about",
+        "teach me about",
+        "help me understand",
+        "what is",
+        "what are",
+        "how to",
+        "how do i",
+    ]
+    for p in prefixes:
+        if t.startswith(p):
+            t = t[len(p):].strip()
+            break
+    t = t.rstrip("?.!")
+    return " ".join(w.capitalize() for w in t.split())
+
+
+def legacy_detect_topic_type(topic: str) -> Tuple[str, float]:
+    t = topic.lower()
+
+    if any(x in t for x in [" vs ", " versus ", "compare"]):
+        return "comparison", 0.67
+
+    if any(x in t for x in ["should i", "better", "choose"]):
+        return "decision", 0.67
+
+    if any(x in t for x in ["error", "not working", "failed", "issue"]):
+        return "troubleshooting", 0.75
+
+    if any(x in t for x in ["learn", "practice", "how to"]):
+        return "skill", 0.67
+
+    return "concept", 0.67
+
+
+def legacy_scan(topic: str, rules) -> Tuple[str, float]:
+    t = topic.lower()
+    for name, conf, kws in rules:
+        if any(x in t for x in kws):
+            return name, conf
+    return "concept", 0.67
+
+
+# -----------------------------
+# Inputs
+# -----------------------------
+SAMPLES: List[str] = [
+    "What is artificial intelligence?",
+    "Explain to me Python vs Rust for CLI tools",
+    "Should I choose Postgres or MySQL?",
+    "docker build failed with permission error",
+    "How do I learn to practice guitar every day",
+    "help me understand photosynthesis",
+    "   tell me about   the French revolution!!  ",
+    "Quantum entanglement",
+]
+
+
+def _synthetic_rules(n: int, seed: int = 7):
+    """Real rules plus n never-matching keywords spread across the types."""
+    rng = random.Random(seed)
+    rules = [(name, conf, list(kws)) for name, conf, kws in TOPIC_TYPE_RULES]
+    for i in range(n):
+        word = "zq" + "".join(rng.choice(string.ascii_lowercase) for _ in range(8))
+        rules[i % len(rules)][2].append(word)
+    return rules
+
+
+def _per_op_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def check_equivalence() -> None:
+    for s in SAMPLES:
+        clean = legacy_extract_topic(s)
+        expected = (clean,) + legacy_detect_topic_type(clean)
+        got = tuple(TopicRules(TOPIC_PREFIXES, TOPIC_TYPE_RULES, detect_cache_size=0).analyze(s))[:3]
+        assert got == expected, (s, got, expected)
+
+
+def main() -> None:
+    check_equivalence()
+    number = 2000
+
+    def legacy():
+        for s in SAMPLES:
+            legacy_detect_topic_type(legacy_extract_topic(s))
+
+    print(f"{'rules':>8} {'legacy us/op':>14} {'compiled us/op':>16}")
+    for extra in (0, 100, 1000, 5000):
+        rules = _synthetic_rules(extra)
+        # Time the match, not the memo.
+        compiled = TopicRules(TOPIC_PREFIXES, rules, detect_cache_size=0, canonical_cache_size=0)
+
+        if extra:
+            def legacy():
+                for s in SAMPLES:
+                    legacy_scan(legacy_extract_topic(s), rules)
+
+        def fast():
+            for s in SAMPLES:
+                compiled.analyze(s)
+
+        n_kw = sum(len(k) for _, _, k in rules)
+        lu = _per_op_us(legacy, number) / len(SAMPLES)
+        fu = _per_op_us(fast, number) / len(SAMPLES)
+        print(f"{n_kw:>8} {lu:>14.2f} {fu:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
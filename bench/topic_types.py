@@ -0,0 +1,123 @@
+# bench/topic_types.py
+#
+# Per-request topic-type cost as the registry grows: the compiled registry
+# (keyword regexes + dict lookups) vs the original style of scanning
+# types in order (if-chains / rule lists), with the 5 real types plus
+# synthetic ones.
+#
+#   python -m bench.topic_types
+#   python -m bench.topic_types --types 0 100 500 2000
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import time
+import timeit
+from typing import Dict, List
+
+from api.topic_rules import TOPIC_PREFIXES, TopicRules
+from api.topic_types import TOPIC_TYPES_DECLARED, TopicType, TopicTypeRegistry
+
+SAMPLES: List[str] = [
+    "What is artificial intelligence?",
+    "Python vs Rust for CLI tools",
+    "Should I choose Postgres or MySQL?",
+    "docker build failed with permission error",
+    "How do I learn to practice guitar every day",
+    "help me understand photosynthesis",
+]
+
+
+def synthetic_types(n: int, seed: int = 11) -> List[TopicType]:
+    """Real types plus n synthetic ones (3 keywords, 4 illustration slots each), before the default."""
+    rng = random.Random(seed)
+    extra = []
+    for i in range(n):
+        words = tuple("zq" + "".join(rng.choice(string.ascii_lowercase) for _ in range(8)) for _ in range(3))
+        extra.append(TopicType(f"synthetic_{i}", 0.6, words, tuple(
+            (f"slot_{j}", f"Synthetic {i} illustration {j} for {{t}}.", f"Heading {j}") for j in range(4)
+        )))
+    *rules, default = TOPIC_TYPES_DECLARED
+    return rules + extra + [default]
+
+
+def samples_for(types: List[TopicType]) -> List[str]:
+    """SAMPLES plus topics that hit the last-declared type (worst case for a scan)."""
+    last = [t for t in types if t.keywords][-1]
+    return SAMPLES + [f"my {last.keywords[0]} setup", f"{last.keywords[-1]} basics"]
+
+
+# -----------------------------
+# Scan-in-order reference (what the if-chains did, generalised)
+# -----------------------------
+def make_scan(types: List[TopicType], default: str):
+    rules = TopicRules(TOPIC_PREFIXES, [], aliases=None)  # same canonicalization, no detection
+
+    def handle(text: str) -> Dict[str, object]:
+        topic = rules.clean(text)
+        t = topic.lower()
+        topic_type = default
+        for tt in types:
+            if tt.name != default and any(k in t for k in tt.keywords):
+                topic_type = tt.name
+                break
+        for tt in types:
+            if tt.name == topic_type:
+                return {
+                    "illustrations": {k: tpl.format(t=topic) for k, tpl, _ in tt.illustrations},
+                    "supports": {k: s for k, _, s in tt.illustrations},
+                }
+        raise KeyError(topic_type)
+
+    return handle
+
+
+def make_compiled(registry: TopicTypeRegistry):
+    rules = TopicRules(
+        TOPIC_PREFIXES, registry.type_rules, registry.default_rule, aliases=None,
+        detect_cache_size=0, canonical_cache_size=0,
+    )
+
+    def handle(text: str) -> Dict[str, object]:
+        topic, topic_type, _, _ = rules.analyze(text)
+        registry.question_set_id(topic_type)
+        return {
+            "illustrations": {k: tpl.format(t=topic) for k, tpl in registry.illustration_templates(topic_type)},
+            "supports": registry.support_map(topic_type),
+        }
+
+    return handle
+
+
+def _per_op_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m bench.topic_types")
+    parser.add_argument("--types", type=int, nargs="+", default=[0, 50, 500])
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    print(f"{'types':>6} {'compile ms':>11} {'q-sets':>7} {'scan us/req':>12} {'compiled us/req':>16}")
+    for n in args.types:
+        types = synthetic_types(n)
+        t0 = time.perf_counter()
+        registry = TopicTypeRegistry(types)
+        compiled = make_compiled(registry)
+        compile_ms = (time.perf_counter() - t0) * 1000.0
+        scan = make_scan(types, registry.default)
+        texts = samples_for(types)
+
+        for text in texts:
+            assert compiled(text) == scan(text), text
+
+        su = _per_op_us(lambda: [scan(t) for t in texts], args.number) / len(texts)
+        cu = _per_op_us(lambda: [compiled(t) for t in texts], args.number) / len(texts)
+        print(f"{len(registry.types):>6} {compile_ms:>11.1f} {len(registry.question_sets):>7} {su:>12.2f} {cu:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
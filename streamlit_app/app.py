@@ -1,6 +1,17 @@
 import hashlib
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from typing import List, NamedTuple
+from urllib.parse import quote
+
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 st.set_page_config(page_title="InI.ai", layout="centered")
 
@@ -27,19 +38,113 @@ label { font-weight: 600; }
 </style>
 """, unsafe_allow_html=True)
 
-API_BASE = "http://127.0.0.1:8000"
+API_BASE = os.getenv("INI_API_BASE", "http://127.0.0.1:8000")
+
+# HTTP client tuning (shared across reruns and sessions)
+HTTP_TIMEOUT = float(os.getenv("INI_HTTP_TIMEOUT", "10"))
+HTTP_RETRIES = int(os.getenv("INI_HTTP_RETRIES", "2"))
+HTTP_POOL_SIZE = int(os.getenv("INI_HTTP_POOL_SIZE", "32"))
+
+# Lazy mode: /interrogate returns questions only; each answer is fetched on click.
+LAZY_ANSWERS = os.getenv("INI_LAZY_ANSWERS", "1") == "1"
+
+# Ask /interrogate for the dictionary-encoded compact format.
+COMPACT_WIRE = os.getenv("INI_COMPACT_WIRE", "1") == "1"
+
+
+# ---------------- HTTP client ----------------
+@st.cache_resource
+def http_session() -> requests.Session:
+    """One keep-alive connection pool for the whole Streamlit server."""
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource
+def fetch_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix="ini-fetch")
 
 
 # ---------------- Helpers ----------------
-def safe_post(path: str, payload: dict, timeout: int = 10):
+def safe_post(path: str, payload: dict, timeout: float = HTTP_TIMEOUT, session=None):
     try:
-        r = requests.post(f"{API_BASE}{path}", json=payload, timeout=timeout)
+        r = (session or http_session()).post(f"{API_BASE}{path}", json=payload, timeout=timeout)
         r.raise_for_status()
         return r.json(), None
     except Exception as e:
         return None, str(e)
 
 
+def safe_get(path: str, timeout: float = HTTP_TIMEOUT):
+    try:
+        r = http_session().get(f"{API_BASE}{path}", timeout=timeout)
+        r.raise_for_status()
+        return r.json(), None
+    except Exception as e:
+        return None, str(e)
+
+
+def post_concurrently(calls):
+    """calls: [(path, payload), ...] -> [(data, err), ...] in the same order."""
+    # Resolve cached resources here: worker threads have no script context.
+    session, pool = http_session(), fetch_pool()
+    futures = [pool.submit(safe_post, path, payload, HTTP_TIMEOUT, session) for path, payload in calls]
+    return [f.result() for f in futures]
+
+
+def get_answer(qa: dict, qid: str) -> str:
+    if qa.get("answer"):
+        return qa["answer"]
+    if qid not in st.session_state.answers:
+        topic = st.session_state.interrogate_input or ""
+        data, err = safe_get(f"/answer/{quote(topic, safe='')}/{quote(qid, safe='')}")
+        if err:
+            return f"Could not load answer: {err}"
+        st.session_state.answers[qid] = data.get("answer", "")
+    return st.session_state.answers[qid]
+
+
+def decode_compact(payload: dict) -> dict:
+    """Expand a format=compact /interrogate payload back to the full shape."""
+    if not payload or payload.get("format") != "compact":
+        return payload
+    strings = payload["strings"]
+    categories = {}
+    for cat, rows in payload["categories"].items():
+        items = []
+        for qid, question, answer, archetype in rows:
+            item = {"id": qid, "archetype": strings[archetype], "question": question}
+            if answer is not None:
+                item["answer"] = strings[answer]
+            items.append(item)
+        categories[cat] = items
+    out = {k: v for k, v in payload.items() if k not in ("format", "fields", "strings", "categories")}
+    out["categories"] = categories
+    return out
+
+
+def record_progress(**fields):
+    """
+    Fire-and-forget POST /progress for this browser session. Posts can
+    arrive out of order, so each carries an increasing seq (wall-clock
+    based, so it keeps increasing after a reload) and the API drops stale ones.
+    """
+    seq = max(st.session_state.get("progress_seq", 0) + 1, time.time_ns())
+    st.session_state.progress_seq = seq
+    payload = {"session_id": st.session_state.session_id, "seq": seq, **fields}
+    fetch_pool().submit(safe_post, "/progress", payload, HTTP_TIMEOUT, http_session())
+
+
+@lru_cache(maxsize=4096)
 def safe_key(text: str) -> str:
     return hashlib.md5(text.encode("utf-8")).hexdigest()
 
@@ -50,6 +155,43 @@ def qa_id(qa: dict, prefix: str):
     return f"{prefix}_{safe_key(qa.get('question',''))}"
 
 
+class QuestionRow(NamedTuple):
+    cat: str
+    qid: str
+    question: str
+    key: str  # widget key suffix
+    qa: dict
+
+
+def question_rows(data: dict) -> List[QuestionRow]:
+    """Flatten an interrogation once per fetch (not on every rerun)."""
+    rows = []
+    for cat, items in ((data or {}).get("categories") or {}).items():
+        if not isinstance(items, list):
+            continue
+        for qa in items:
+            if qa.get("question") and (LAZY_ANSWERS or qa.get("answer")):
+                qid = qa_id(qa, cat.lower().replace(" ", "_"))
+                rows.append(QuestionRow(cat, qid, qa["question"], safe_key(qid), qa))
+    return rows
+
+
+def group_rows(rows: List[QuestionRow]):
+    return [(cat, list(grp)) for cat, grp in groupby(rows, key=lambda r: r.cat)]
+
+
+# st.fragment (Streamlit >= 1.37) reruns a single function instead of the
+# whole script; older versions fall back to full reruns.
+FRAGMENTS = hasattr(st, "fragment")
+fragment = st.fragment if FRAGMENTS else (lambda fn: fn)
+
+
+def rerun_fragment():
+    if FRAGMENTS:
+        st.rerun(scope="fragment")
+    st.rerun()
+
+
 # ---------------- State ----------------
 if "interrogate_data" not in st.session_state:
     st.session_state.interrogate_data = None
@@ -63,6 +205,16 @@ if "illustrate_data" not in st.session_state:
 if "illustrate_err" not in st.session_state:
     st.session_state.illustrate_err = None
 
+if "interrogate_input" not in st.session_state:
+    st.session_state.interrogate_input = None
+
+if "answers" not in st.session_state:
+    st.session_state.answers = {}
+
+if "interrogate_rows" not in st.session_state:
+    st.session_state.interrogate_rows = []
+    st.session_state.interrogate_groups = []
+
 if "last_topic" not in st.session_state:
     st.session_state.last_topic = None
 
@@ -76,6 +228,16 @@ if "open_ids" not in st.session_state:
 if "viewed_ids" not in st.session_state:
     st.session_state.viewed_ids = set()
 
+# Session id lives in the URL, so a reload resumes the same progress.
+if "session_id" not in st.session_state:
+    sid = st.query_params.get("sid") or uuid.uuid4().hex
+    st.query_params["sid"] = sid
+    st.session_state.session_id = sid
+
+    # First run for this browser tab: restore the last topic from the API.
+    data, err = safe_post("/resume", {"session_id": sid})
+    st.session_state.resumed = (data or {}).get("session") if not err else None
+
 
 # ---------------- UI: Home ----------------
 st.title("InI.ai")
@@ -86,18 +248,65 @@ topic = st.text_area(
     height=110
 )
 
-c1, c2 = st.columns(2)
+c1, c2, c3 = st.columns(3)
 with c1:
     interrogate_clicked = st.button("Interrogate")
 with c2:
     illustrate_clicked = st.button("Illustrate")
+with c3:
+    both_clicked = st.button("Both")
+
+want_interrogate = (interrogate_clicked or both_clicked) and topic.strip()
+want_illustrate = (illustrate_clicked or both_clicked) and topic.strip()
+interrogate_params = []
+if LAZY_ANSWERS:
+    interrogate_params.append("answers=false")
+if COMPACT_WIRE:
+    interrogate_params.append("format=compact")
+interrogate_path = "/interrogate" + ("?" + "&".join(interrogate_params) if interrogate_params else "")
+
+# Both panes: one /explore round trip (shared topic analysis); if the API
+# has no /explore, fetch both in parallel instead of back to back.
+if want_interrogate and want_illustrate:
+    data, err = safe_post("/explore", {
+        "topic": topic,
+        "sections": ["interrogation", "illustration"],
+        "answers": not LAZY_ANSWERS,
+    })
+    if data and not err:
+        interrogate_result = (data.get("interrogation"), None)
+        illustrate_result = (data.get("illustration"), None)
+    else:
+        interrogate_result, illustrate_result = post_concurrently([
+            (interrogate_path, {"topic": topic}),
+            ("/illustrate", {"topic": topic}),
+        ])
+elif want_interrogate:
+    interrogate_result, illustrate_result = safe_post(interrogate_path, {"topic": topic}), None
+elif want_illustrate:
+    interrogate_result, illustrate_result = None, safe_post("/illustrate", {"topic": topic})
+else:
+    interrogate_result = illustrate_result = None
+
+# Resumed session: re-fetch its last topic once (the API cache makes this cheap).
+resumed = st.session_state.get("resumed")
+resume_topic = None
+if interrogate_result is None and resumed and resumed.get("topic"):
+    resume_topic = resumed["topic"]
+    interrogate_result = safe_post(interrogate_path, {"topic": resume_topic})
+st.session_state.resumed = None
 
 
 # ---------------- Interrogate: fetch ----------------
-if interrogate_clicked and topic.strip():
-    data, err = safe_post("/interrogate", {"topic": topic})
+if interrogate_result is not None:
+    data, err = interrogate_result
+    data = decode_compact(data)
     st.session_state.interrogate_data = data
     st.session_state.interrogate_err = err
+    st.session_state.interrogate_input = resume_topic or topic
+    st.session_state.interrogate_rows = question_rows(data) if not err else []
+    st.session_state.interrogate_groups = group_rows(st.session_state.interrogate_rows)
+    st.session_state.answers = {}
 
     if data and not err:
         clean = data.get("topic", "").strip().lower()
@@ -106,116 +315,108 @@ if interrogate_clicked and topic.strip():
             st.session_state.show_more = False
             st.session_state.open_ids = set()
             st.session_state.viewed_ids = set()
+        if resume_topic:
+            st.session_state.viewed_ids = set(resumed.get("viewed", []))
+            st.session_state.open_ids = set(resumed.get("open", []))
+        else:
+            record_progress(topic=data.get("topic", ""))
 
 
 # ---------------- Illustrate: fetch ----------------
-if illustrate_clicked and topic.strip():
-    data, err = safe_post("/illustrate", {"topic": topic})
+if illustrate_result is not None:
+    data, err = illustrate_result
     st.session_state.illustrate_data = data
     st.session_state.illustrate_err = err
 
 
 # ---------------- Interrogate: render ----------------
-idata = st.session_state.interrogate_data
-ierr = st.session_state.interrogate_err
-
-if ierr:
-    st.error(ierr)
+# Each pane is a fragment, and so is each question card: toggling an answer
+# reruns only that card, and pane buttons rerun only their pane.
+@fragment
+def question_card(row: QuestionRow, slot: str):
+    qid = row.qid
+    dot = "🔵" if qid in st.session_state.viewed_ids else "⚪"
+
+    if st.button(f"{dot} {row.question}", key=f"{slot}_{row.key}"):
+        if qid in st.session_state.open_ids:
+            st.session_state.open_ids.remove(qid)
+            record_progress(open=sorted(st.session_state.open_ids))
+        else:
+            st.session_state.open_ids.add(qid)
+            st.session_state.viewed_ids.add(qid)
+            record_progress(viewed=[qid], open=sorted(st.session_state.open_ids))
+        rerun_fragment()
+
+    # answer directly below the question
+    if qid in st.session_state.open_ids:
+        with st.expander("", expanded=True):
+            st.write(get_answer(row.qa, qid))
+
+
+@fragment
+def interrogation_pane():
+    idata = st.session_state.interrogate_data
+    ierr = st.session_state.interrogate_err
+
+    if ierr:
+        st.error(ierr)
+
+    if not idata or ierr:
+        return
 
-if idata and not ierr:
     st.subheader(f"Interrogating: {idata.get('topic','')}")
 
     # short orientation
     for line in idata.get("summary", []):
         st.write(line)
 
-    categories = idata.get("categories", {}) or {}
-
-    # flatten questions
-    flat = []
-    for cat, items in categories.items():
-        if isinstance(items, list):
-            for qa in items:
-                if qa.get("question") and qa.get("answer"):
-                    flat.append((cat, qa))
 
     # ONE clear button (works in both views)
     if st.button("Clear opened answers", key="clear_opened"):
         st.session_state.open_ids = set()
-        st.rerun()
+        record_progress(open=[])
+        rerun_fragment()
 
     # -------- Top 7 --------
     if not st.session_state.show_more:
         st.markdown("### Top most questions")
 
-        for idx, (cat, qa) in enumerate(flat[:7], start=1):
-            qid = qa_id(qa, cat.lower().replace(" ", "_"))
-            q = qa["question"]
-            a = qa["answer"]
-
-            visited = qid in st.session_state.viewed_ids
-            dot = "🔵" if visited else "⚪"
-
-            if st.button(f"{dot} {q}", key=f"top_{idx}_{safe_key(qid)}"):
-                if qid in st.session_state.open_ids:
-                    st.session_state.open_ids.remove(qid)
-                else:
-                    st.session_state.open_ids.add(qid)
-                    st.session_state.viewed_ids.add(qid)
-                st.rerun()
-
-            # answer directly below the question
-            if qid in st.session_state.open_ids:
-                with st.expander("", expanded=True):
-                    st.write(a)
+        for idx, row in enumerate(st.session_state.interrogate_rows[:7], start=1):
+            question_card(row, f"top_{idx}")
 
         if st.button("See more…", key="see_more_btn"):
             st.session_state.show_more = True
-            st.rerun()
+            rerun_fragment()
 
     # -------- All questions --------
     else:
         st.markdown("### All questions")
 
-        for cat, items in categories.items():
+        for cat, cat_rows in st.session_state.interrogate_groups:
             st.markdown(f"#### {cat}")
-            for qa in items:
-                if not qa.get("question") or not qa.get("answer"):
-                    continue
-
-                qid = qa_id(qa, cat.lower().replace(" ", "_"))
-                q = qa["question"]
-                a = qa["answer"]
-
-                visited = qid in st.session_state.viewed_ids
-                dot = "🔵" if visited else "⚪"
-
-                if st.button(f"{dot} {q}", key=f"all_{safe_key(qid)}"):
-                    if qid in st.session_state.open_ids:
-                        st.session_state.open_ids.remove(qid)
-                    else:
-                        st.session_state.open_ids.add(qid)
-                        st.session_state.viewed_ids.add(qid)
-                    st.rerun()
-
-                if qid in st.session_state.open_ids:
-                    with st.expander("", expanded=True):
-                        st.write(a)
+            for row in cat_rows:
+                question_card(row, "all")
 
         if st.button("Back", key="back_btn"):
             st.session_state.show_more = False
-            st.rerun()
+            rerun_fragment()
 
 
 # ---------------- Illustrate: render ----------------
-ldata = st.session_state.illustrate_data
-lerr = st.session_state.illustrate_err
+@fragment
+def illustration_pane():
+    ldata = st.session_state.illustrate_data
+    lerr = st.session_state.illustrate_err
+
+    if lerr:
+        st.error(lerr)
+
+    if ldata and not lerr:
+        st.subheader(f"Illustrating: {ldata.get('topic','')}")
+        for k, v in (ldata.get("illustrations") or {}).items():
+            st.markdown(f"**{k.replace('_',' ').title()}**")
+            st.write(v)
 
-if lerr:
-    st.error(lerr)
 
-if ldata and not lerr:
-    st.subheader(f"Illustrating: {ldata.get('topic','')}")
-    for k, v in (ldata.get("illustrations") or {}).items():
-        st.markdown(f"**{k.replace('_',' ').title()}**")
-        st.write(v)
+interrogation_pane()
+illustration_pane()